@@ -6,12 +6,22 @@ Main script for the NetLogo to LUCIM conversion agent.
 This single agent handles the entire pipeline from NetLogo code to a compliant PlantUML diagram.
 """
 
+import io
 import os
 import sys
 import argparse
-from datetime import datetime
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import base64
+import hashlib
+import json
+import logging
 import re
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
 
 # Add project root to Python path
 project_root = os.path.dirname(os.path.abspath(__file__))
@@ -26,59 +36,706 @@ try:
     import utils_fileio as fileio
     import utils_format as fmt
     import utils_plantuml as plantuml
+    import utils_rate_limit as rate_limit
     import utils_ui as ui
+    from utils_api_key import create_openai_client, get_api_key_for_model, get_provider_for_model
+    from utils_audit_diagram import audit_diagram
+    from utils_audit_operation_model import audit_operation_model
+    from utils_audit_scenario import audit_scenario
+    from utils_run_logging import OrchestratorLogger
 except ImportError as e:
     print(f"Error: Failed to import utility modules. Make sure they are in the project root. Details: {e}")
     sys.exit(1)
 
+# Shared across all runs in a process so concurrent --cases workers pace
+# themselves under the provider's rate limits instead of tripping 429s
+_RATE_LIMITER = rate_limit.TokenBucket()
+
+# Optional fast JSON serializer (do not fail hard if missing)
+try:
+    import orjson  # type: ignore
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
+
+
+def _write_raw_response_json(filepath, data):
+    """Serialize the raw API response dict to disk, preferring orjson.
+
+    orjson emits bytes directly from C, which is markedly faster than stdlib
+    json for large responses (reasoning summaries, image echoes). Falls back
+    to fileio.write_json when orjson is not installed.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            fileio.write_bytes(filepath, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
+        except Exception as e:
+            print(f"Warning: orjson serialization failed, falling back to stdlib json: {e}")
+    fileio.write_json(filepath, data)
+
+
+def _write_json_payload(filepath, payload):
+    """Write a payload as indented JSON, plumbing orjson bytes end-to-end.
+
+    orjson already emits UTF-8 bytes, so handing them to a binary write skips
+    the decode-to-str plus re-encode-on-write round trip the text path pays.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            fileio.write_bytes(filepath, orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+            return
+        except Exception as e:
+            print(f"Warning: orjson serialization failed, falling back to stdlib json: {e}")
+    fileio.write_file_content(filepath, json.dumps(payload, indent=2, ensure_ascii=False))
+
+
+class _CachedResponse:
+    """Replay a cached raw-response dict through the response accessors.
+
+    Exposes just enough of the Responses API object surface (to_dict,
+    output_text, usage) for the downstream save/parse pipeline to treat a
+    cache hit exactly like a live response.
+    """
+
+    def __init__(self, raw):
+        self._raw = raw
+
+    def to_dict(self):
+        return self._raw
+
+    @property
+    def output_text(self):
+        return _batch_output_text(self._raw) or ""
+
+    @property
+    def usage(self):
+        usage = self._raw.get("usage")
+        if not isinstance(usage, dict):
+            return None
+        details = usage.get("output_tokens_details")
+        ns = SimpleNamespace(**{k: v for k, v in usage.items() if k != "output_tokens_details"})
+        ns.output_tokens_details = SimpleNamespace(**details) if isinstance(details, dict) else None
+        return ns
+
+
+def _response_cache_path(model, reasoning, verbosity, system_prompt):
+    """Content-addressed cache file for one (model, knobs, prompt) tuple."""
+    cache_key = hashlib.sha256(
+        "|".join([model, reasoning or "", verbosity or "", system_prompt]).encode("utf-8")
+    ).hexdigest()
+    cache_dir = cfg.OUTPUT_DIR / "response-cache"
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, f"{cache_key}.json")
+
+
+def _load_cached_response(cache_path):
+    """Return a _CachedResponse for cache_path, or None when absent/corrupt."""
+    try:
+        with open(cache_path, "rb") as f:
+            payload = f.read()
+    except OSError:
+        return None
+    try:
+        raw = orjson.loads(payload) if ORJSON_AVAILABLE else json.loads(payload.decode("utf-8"))
+    except Exception:
+        return None
+    return _CachedResponse(raw) if isinstance(raw, dict) else None
+
+
+def _dumps_json_text(data):
+    """Serialize a stage payload to indented JSON text, preferring orjson."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except Exception:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _save_stage(artifact, stage_dir, filename):
+    """Serialize one parsed stage artifact into stage_dir/filename.
+
+    Returns the written text so the audit step can reuse it, or None when
+    the artifact is missing or carries no data.
+    """
+    if not artifact:
+        return None
+    data = artifact.get("data")
+    if data is None:
+        return None
+    text = _dumps_json_text(data) if isinstance(data, dict) else str(data)
+    fileio.write_file_content(os.path.join(stage_dir, filename), text)
+    return text
+
+
+def _verdict_payload(audit_result):
+    """Shape a deterministic-audit result into the auditor output-data format."""
+    violations = audit_result.get("violations", [])
+    return {
+        "verdict": "compliant" if audit_result.get("verdict") else "non-compliant",
+        "non-compliant-rules": [v.get("id") for v in violations],
+        "violations": violations,
+    }
+
+
+# Keys of input_contents that never belong in the text prompt: images travel
+# as structured input_image entries and task instructions head the list.
+_SKIP_KEYS = frozenset({"netlogo_images", "task_instructions"})
+
+
+def _gen_parts(input_contents):
+    """Yield the text sections of the prompt in order (task instructions first)."""
+    task_instructions = input_contents.get("task_instructions")
+    if task_instructions:
+        yield task_instructions
+    for key, content in input_contents.items():
+        if key not in _SKIP_KEYS:
+            yield f"\n--- {key.upper()} ---\n{content}"
+
+
 def build_api_input(input_contents):
     """Builds the list of messages for the AI model's 'input' field."""
 
-    # Combine all text inputs (task instructions should head the list)
-    text_parts = []
-    if "task_instructions" in input_contents and input_contents["task_instructions"]:
-        text_parts.append(input_contents["task_instructions"])
-    for key, content in input_contents.items():
-        if key not in ["netlogo_images"]:
-            text_parts.append(f"\n--- {key.upper()} ---\n{content}")
-    
-    full_text_prompt = "\n".join(text_parts)
+    # Combine all text inputs (task instructions should head the list).
+    # Images never enter the text prompt: they are attached below as structured
+    # input_image entries, so the base64 payload is not duplicated in the text.
+    # Joining over the generator skips the intermediate parts list entirely.
+    full_text_prompt = "\n".join(_gen_parts(input_contents))
     
     # Create the message structure for the 'input' field
     user_content = [{"type": "input_text", "text": full_text_prompt}]
     
-    # Add images to the message content
-    if "netlogo_images" in input_contents:
-        for img_base64 in input_contents["netlogo_images"]:
-            # Responses API expects 'input_image' with an image URL; use data URL with base64
-            user_content.append({
-                "type": "input_image",
-                "image_url": f"data:image/png;base64,{img_base64}"
-            })
-            
+    # Add images to the message content; the loader already produced
+    # complete data URLs, so each entry is attached without another copy
+    for image_url in input_contents.get("netlogo_images", []):
+        user_content.append({
+            "type": "input_image",
+            "image_url": image_url
+        })
+
     return [{"role": "user", "content": user_content}]
 
-def parse_and_save_artifacts(output_text, output_dir, logger):
-    """Parses the AI's text output to extract and save diagrams and audits."""
-    import re
 
+def build_minimal_api_input(input_contents):
+    """Build the 'input' messages when the full prompt travels as 'instructions'.
+
+    The composite prompt already embeds the task, personas, rules and NetLogo
+    source, so the user message carries only a short directive plus the
+    structured input_image entries; none of the large text is uploaded twice.
+    """
+    user_content = [{"type": "input_text", "text": "Produce the JSON per the instructions."}]
+    for image_url in input_contents.get("netlogo_images", []):
+        user_content.append({
+            "type": "input_image",
+            "image_url": image_url
+        })
+    return [{"role": "user", "content": user_content}]
+
+
+# Stage-task helpers share these patterns; compiling them once at import time
+# avoids re-running the regex compiler for every stage of every run.
+_TASK_TAG_RE = re.compile(r"</?TASK>")
+_WS_RE = re.compile(r"\s+")
+# Matches a stage header line ("1)" .. "8)") followed by its "- Persona:" bullet;
+# group 2 carries the stage index so one pass can serve all eight stages.
+_STAGE_RE = re.compile(r"(\n\s*([1-8])\)\s[^\n]*\n)(\s*-\s*Persona:)")
+_PERSONA_INDENT_RE = re.compile(r"(\s*)-\s*Persona:")
+
+@functools.lru_cache(maxsize=1)
+def _task_dir_index():
+    """Map file name -> path for every file under input-task.
+
+    A single scandir replaces the per-step os.path.exists probes; the result
+    is cached for the process lifetime since task files do not change mid-run.
+    """
+    task_dir = os.path.join(project_root, "input-task")
+    try:
+        with os.scandir(task_dir) as entries:
+            return {entry.name: entry.path for entry in entries if entry.is_file()}
+    except OSError:
+        return {}
+
+
+@functools.lru_cache(maxsize=16)
+def _load_step_task(step_index: int) -> str:
+    """Load the per-stage task content from input-task/step-<n>-task as a single line.
+    Returns an empty string if the file is missing or unreadable.
+    """
+    try:
+        step_path = _task_dir_index().get(f"step-{step_index}-task")
+        if step_path:
+            content = fileio.read_file_content(step_path).strip()
+            # Remove optional <TASK> wrappers if present
+            content = _TASK_TAG_RE.sub("", content)
+            # Normalize whitespace to keep it on a single line for compact prompts
+            one_line = _WS_RE.sub(" ", content).strip()
+            return one_line
+    except Exception:
+        pass
+    return ""
+
+@functools.lru_cache(maxsize=1)
+def _load_step_2a_task() -> str:
+    """Load the per-stage task content from input-task/step-2a-task as a single line.
+    Returns an empty string if the file is missing or unreadable.
+    """
+    try:
+        step_path = _task_dir_index().get("step-2a-task")
+        if step_path:
+            content = fileio.read_file_content(step_path).strip()
+            content = _TASK_TAG_RE.sub("", content)
+            one_line = _WS_RE.sub(" ", content).strip()
+            return one_line
+    except Exception:
+        pass
+    return ""
+
+def _inject_stage_tasks_into_task_instructions(text: str) -> str:
+    """Insert a 'Task: <content>' line just before the '- Persona:' line for each stage (1..8).
+    The insertion preserves indentation and does not modify existing lines.
+    """
+    if not text:
+        return text
+
+    # Common dev-environment case: no step-N-task files at all. The cached
+    # directory index answers that without file reads or regex work.
+    task_index = _task_dir_index()
+    if not any(f"step-{idx}-task" in task_index for idx in range(1, 9)):
+        return text
+
+    # Preload every stage task once, then let a single scan of the text
+    # handle all eight stages instead of one re.sub pass per stage.
+    step_tasks = {str(idx): _load_step_task(idx) for idx in range(1, 9)}
+    if not any(step_tasks.values()):
+        return text
+
+    injected = set()
+
+    def _repl(match: re.Match) -> str:
+        step_idx = match.group(2)
+        step_task = step_tasks.get(step_idx, "")
+        # Only inject on the first occurrence of each stage header
+        if not step_task or step_idx in injected:
+            return match.group(0)
+        injected.add(step_idx)
+        header = match.group(1)
+        persona_marker = match.group(3)
+        indent_match = _PERSONA_INDENT_RE.match(persona_marker)
+        indent = indent_match.group(1) if indent_match else "   "
+        task_line = f"{indent}- Task: {step_task}\n"
+        return f"{header}{task_line}{persona_marker}"
+
+    return _STAGE_RE.sub(_repl, text)
+
+
+# Fenced JSON block in a model response; the optional "json" tag covers both
+# ```json and bare ``` fences in one compiled pattern. The lazy capture stops
+# at the first closing fence, so a response carrying several fenced blocks
+# yields the first object instead of a span across all of them.
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+
+def _extract_json_object(text):
+    """Return the first top-level JSON object embedded in text, or None.
+
+    Prefers a fenced code block; otherwise scans the text once tracking brace
+    depth and string/escape state, so prose before or after the object (which
+    a naive find("{")/rfind("}") slice would drag in) is excluded.
+    """
+    match = _JSON_FENCE_RE.search(text)
+    if match:
+        return match.group(1)
+
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    for index, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"' and depth > 0:
+            in_string = True
+        elif char == "{":
+            if depth == 0:
+                start = index
+            depth += 1
+        elif char == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                return text[start:index + 1]
+    return None
+
+def _parse_single_call_response(response_text, logger):
+    """Parse a 3-stage JSON response into operation model, scenario, and PlantUML.
+
+    Shared by the single-call and batch paths: both request the same JSON
+    envelope via _build_v3_adk_composite_prompt, so the extraction and schema
+    guards are identical.
+    """
     artifacts = {
-        "diagram_initial": r"\[START_INITIAL_DIAGRAM\](.*?)\[END_INITIAL_DIAGRAM\]",
-        "audit_initial": r"\[START_INITIAL_AUDIT\](.*?)\[END_INITIAL_AUDIT\]",
-        "diagram_corrected": r"\[START_CORRECTED_DIAGRAM\](.*?)\[END_CORRECTED_DIAGRAM\]",
-        "audit_final": r"\[START_FINAL_AUDIT\](.*?)\[END_FINAL_AUDIT\]",
+        "operation_model": None,
+        "scenario": None,
+        "plantuml_diagram": None
     }
 
-    for name, pattern in artifacts.items():
-        match = re.search(pattern, output_text, re.DOTALL)
-        if match:
-            content = match.group(1).strip()
-            extension = ".puml" if "diagram" in name else ".json"
-            filepath = os.path.join(output_dir, f"{name}{extension}")
-            fileio.write_file_content(filepath, content)
-            logger.info(f"Extracted and saved artifact: {name}{extension}")
+    if not response_text or not isinstance(response_text, str):
+        logger.error("Response text is empty or invalid")
+        return artifacts
+
+    try:
+        # Try to parse as JSON first: prefer a fenced block, then fall
+        # back to the balanced-brace scan over the raw text.
+        json_content = _extract_json_object(response_text)
+        if json_content:
+            parsed = json.loads(json_content)
+
+            # Schema validation: check for required top-level keys
+            required_keys = ["operation_model", "scenario", "plantuml_diagram"]
+            missing_keys = [k for k in required_keys if k not in parsed]
+            if missing_keys:
+                logger.warning("Missing required keys in response: %s", missing_keys)
+
+            # Extract operation model with schema guard
+            if "operation_model" in parsed:
+                op_model = parsed["operation_model"]
+                if isinstance(op_model, dict) and "data" in op_model:
+                    artifacts["operation_model"] = op_model
+                else:
+                    logger.warning("operation_model missing 'data' key or invalid structure")
+
+            # Extract scenario with schema guard
+            if "scenario" in parsed:
+                scenario = parsed["scenario"]
+                if isinstance(scenario, dict) and "data" in scenario:
+                    artifacts["scenario"] = scenario
+                else:
+                    logger.warning("scenario missing 'data' key or invalid structure")
+
+            # Extract PlantUML diagram with schema guard
+            if "plantuml_diagram" in parsed:
+                puml = parsed["plantuml_diagram"]
+                if isinstance(puml, dict) and "data" in puml:
+                    puml_data = puml["data"]
+                    if isinstance(puml_data, dict) and "plantuml-diagram" in puml_data:
+                        artifacts["plantuml_diagram"] = puml
+                    else:
+                        logger.warning("plantuml_diagram.data missing 'plantuml-diagram' key")
+                else:
+                    logger.warning("plantuml_diagram missing 'data' key or invalid structure")
+
+            logger.info("Successfully parsed structured JSON response with schema validation.")
+            return artifacts
+    except (json.JSONDecodeError, KeyError, ValueError) as e:
+        logger.warning("Failed to parse structured JSON response: %s", e)
+
+    # Fallback: try to extract from text patterns
+    logger.info("Attempting fallback extraction from text patterns...")
+
+    # Try to extract PlantUML (look for @startuml...@enduml); the two
+    # partitions scan each byte once instead of find+find+slice.
+    _, start_marker, tail = response_text.partition("@startuml")
+    if start_marker:
+        body, end_marker, _ = tail.partition("@enduml")
+        if end_marker:
+            artifacts["plantuml_diagram"] = {
+                "data": {"plantuml-diagram": f"@startuml{body}@enduml"},
+                "errors": []
+            }
+            logger.info("Extracted PlantUML diagram from text patterns.")
+
+    return artifacts
+
+
+def _save_stage_artifacts(parsed_artifacts, output_dir, logger):
+    """Create the v3 stage directories and persist the parsed artifacts.
+
+    Returns (op_model_text, scenario_text) so the single-call audit step can
+    reuse the already-serialized stage texts instead of re-encoding the dicts.
+    """
+    out_prefix = os.fspath(output_dir).rstrip(os.sep) + os.sep
+
+    # One loop creates the three stage directories, and the computed paths
+    # are reused by the save blocks below instead of being re-joined.
+    stage1_dir, stage2_dir, stage3_dir = (
+        os.path.join(f"{out_prefix}{sub}", "iter-1", "1-generator")
+        for sub in ("1_lucim_operation_model", "2_lucim_scenario", "3_lucim_plantuml_diagram")
+    )
+    for stage_dir in (stage1_dir, stage2_dir, stage3_dir):
+        generator_dir = Path(stage_dir)
+        generator_dir.mkdir(parents=True, exist_ok=True)
+        # Pre-create the auditor sibling too, so later audit saves only
+        # perform the file write.
+        generator_dir.parent.joinpath("2-auditor").mkdir(exist_ok=True)
+
+    # Save Stages 1 and 2 through the shared helper; the returned texts are
+    # kept so the audit section can reuse them instead of re-encoding the
+    # same dicts. Stage 3 stays special-cased because it also emits
+    # diagram.puml and hard-links the duplicate.
+    op_model_text = _save_stage(parsed_artifacts["operation_model"], stage1_dir, "output-data.json")
+    if op_model_text is not None:
+        logger.info("Saved operation model to Stage 1 directory.")
+
+    scenario_text = _save_stage(parsed_artifacts["scenario"], stage2_dir, "output-data.json")
+    if scenario_text is not None:
+        logger.info("Saved scenario to Stage 2 directory.")
+
+    # Save Stage 3: PlantUML Diagram
+    if parsed_artifacts["plantuml_diagram"]:
+        puml_data = parsed_artifacts["plantuml_diagram"].get("data", {})
+        if isinstance(puml_data, dict) and "plantuml-diagram" in puml_data:
+            puml_text = puml_data["plantuml-diagram"]
+            # Save as .puml file
+            diagram_path = os.path.join(stage3_dir, "diagram.puml")
+            output_data_path = os.path.join(stage3_dir, "output-data.json")
+            fileio.write_file_content(diagram_path, puml_text)
+            # output-data.json carries the same raw text; hard-link it to
+            # the .puml file instead of writing the payload a second time
+            # (filesystems without hardlink support fall back to a write).
+            try:
+                if os.path.exists(output_data_path):
+                    os.remove(output_data_path)
+                os.link(diagram_path, output_data_path)
+            except OSError:
+                fileio.write_file_content(output_data_path, puml_text)
+            logger.info("Saved PlantUML diagram to Stage 3 directory.")
+
+    return op_model_text, scenario_text
+
+def _safe_read(path: str) -> str:
+    """Best-effort read that serves repeats from the prompt-file cache."""
+    return _cached_prompt_file(str(path)) if path else ""
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_prompt_file(path: str) -> str:
+    """Read a persona/rules prompt file once per process (they are static)."""
+    try:
+        return fileio.read_file_content(path)
+    except Exception:
+        return ""
+
+
+# Output-format instructions appended to every composite prompt; built once
+# at import time instead of being re-allocated on each call.
+_OUTPUT_FORMAT_BLOCK = """
+=== OUTPUT FORMAT REQUIREMENTS ===
+
+You must produce a single JSON response with the following structure:
+
+{
+  "operation_model": {
+"data": <LUCIM Operation Model JSON object>,
+"errors": []
+  },
+  "scenario": {
+"data": {
+  "scenario": {
+    "name": "<scenario name>",
+    "description": "<scenario description>",
+    "messages": [<array of scenario messages>]
+  }
+},
+"errors": []
+  },
+  "plantuml_diagram": {
+"data": {
+  "plantuml-diagram": "<PlantUML diagram text between @startuml and @enduml>"
+},
+"errors": []
+  }
+}
+
+CRITICAL: 
+- The operation_model.data must be a valid JSON object (no Markdown fences, no text outside JSON)
+- The scenario.data must follow the LUCIM Scenario JSON format
+- The plantuml_diagram.data["plantuml-diagram"] must contain the complete PlantUML diagram text (including @startuml and @enduml markers, no Markdown fences)
+- All three stages must be completed in this single response
+"""
+
+
+
+# Build v3 ADK-compatible composite prompt for single-call mode
+def _build_v3_adk_composite_prompt(persona_set, netlogo_code_content, image_count):
+    """Build a composite prompt that requests all 3 stages in a single LLM call."""
+    # Stream the blocks straight into one buffer instead of accumulating a
+    # list of large strings and joining at the end; personas can be tens of
+    # kilobytes each, so this keeps only one copy of the prompt in memory.
+    buf = io.StringIO()
+
+    def _emit(block):
+        block = (block or "").strip()
+        if block:
+            if buf.tell():
+                buf.write("\n\n")
+            buf.write(block)
+
+    def _emit_parts(*parts):
+        # Write each part separately so large payloads (the NetLogo source)
+        # are never copied into an intermediate f-string first.
+        if buf.tell():
+            buf.write("\n\n")
+        for part in parts:
+            buf.write(part)
+
+    # Load v3 ADK personas and rules. One scandir tells us which files exist,
+    # so missing files cost a set probe instead of a stat, and present files
+    # are served from the per-process read cache on repeat builds.
+    persona_dir = cfg.INPUT_PERSONA_DIR / persona_set
+    try:
+        with os.scandir(persona_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        present = set()
+
+    def _prompt_file(name: str) -> str:
+        return _cached_prompt_file(str(persona_dir / name)) if name in present else ""
+
+    # Stage 1: LUCIM Operation Model Generator
+    persona_op_model = _prompt_file("PSN_LUCIM_Operation_Model_Generator.md")
+    if persona_op_model:
+        _emit("=== STAGE 1: LUCIM OPERATION MODEL GENERATION ===")
+        _emit(persona_op_model)
+    
+    # Load NetLogo to LUCIM mapping
+    netlogo_mapping = _prompt_file("RULES_MAPPING_NETLOGO_TO_OPERATION_MODEL.md")
+    if netlogo_mapping:
+        _emit(f"<NETLOGO-TO-LUCIM-MAPPING>\n{netlogo_mapping}\n</NETLOGO-TO-LUCIM-MAPPING>")
+    
+    # Load LUCIM Operation Model rules
+    rules_op_model = _prompt_file("RULES_LUCIM_Operation_model.md")
+    if rules_op_model:
+        _emit(f"<LUCIM-OPERATION-MODEL-RULES>\n{rules_op_model}\n</LUCIM-OPERATION-MODEL-RULES>")
+    
+    # Stage 2: LUCIM Scenario Generator
+    persona_scenario = _prompt_file("PSN_LUCIM_Scenario_Generator.md")
+    if persona_scenario:
+        _emit("=== STAGE 2: LUCIM SCENARIO GENERATION ===")
+        _emit(persona_scenario)
+    
+    # Load Scenario rules
+    rules_scenario = _prompt_file("RULES_LUCIM_Scenario.md")
+    if rules_scenario:
+        _emit(f"<LUCIM-SCENARIO-RULES>\n{rules_scenario}\n</LUCIM-SCENARIO-RULES>")
+    
+    # Stage 3: LUCIM PlantUML Diagram Generator
+    persona_plantuml = _prompt_file("PSN_LUCIM_PlantUML_Diagram_Generator.md")
+    if persona_plantuml:
+        _emit("=== STAGE 3: LUCIM PLANTUML DIAGRAM GENERATION ===")
+        _emit(persona_plantuml)
+    
+    # Load PlantUML Diagram rules
+    rules_plantuml = _prompt_file("RULES_LUCIM_PlantUML_Diagram.md")
+    if rules_plantuml:
+        _emit(f"<LUCIM-PLANTUML-DIAGRAM-RULES>\n{rules_plantuml}\n</LUCIM-PLANTUML-DIAGRAM-RULES>")
+    
+    # Add NetLogo source code
+    _emit_parts("<NETLOGO-SOURCE-CODE>\n", netlogo_code_content, "\n</NETLOGO-SOURCE-CODE>")
+    if image_count:
+        _emit(
+            f"<NETLOGO-INTERFACE-IMAGES>\ncount={image_count}\n</NETLOGO-INTERFACE-IMAGES>"
+        )
+    
+    # Add output format instructions for structured response
+    _emit(_OUTPUT_FORMAT_BLOCK)
+
+    return buf.getvalue()
+
+def _batch_output_text(body):
+    """Extract the message text from a Responses API body dict in a batch result line."""
+    for item in body.get("output", []) or []:
+        if item.get("type") == "message":
+            for part in item.get("content", []) or []:
+                if part.get("type") in ("output_text", "text") and isinstance(part.get("text"), str):
+                    return part["text"]
+    return ""
+
+def run_batch_api(cases, persona_set, model, reasoning, verbosity):
+    """Process many cases through the OpenAI Batch API (50% cost, 24h SLA).
+
+    Builds one /v1/responses request per case, submits them as a single batch
+    job, waits for completion, then saves the raw response and extracts the
+    artifacts for each case into its own run output directory.
+
+    Returns True when the batch completed and every case produced output text.
+    """
+    logger = logging.getLogger("agent_batch")
+    if not logger.handlers:
+        handler = logging.StreamHandler(stream=sys.__stdout__)
+        handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+
+    run_name = time.strftime("%Y%m%d_%H%M%S")
+
+    requests = []
+    output_dirs = {}
+    for case in cases:
+        output_dir = fileio.create_run_output_directory(
+            run_name, case, model, persona_set, reasoning=reasoning, verbosity=verbosity
+        )
+        netlogo_code_content = fileio.read_netlogo_case_content(case)
+        # The persona bundle is already embedded in the composite prompt;
+        # build_minimal_api_input only reads netlogo_images, so only the
+        # images need loading here.
+        encoded_images = fileio.load_and_encode_images(case, logger)
+        input_contents = {"netlogo_images": encoded_images} if encoded_images else {}
+
+        system_prompt = _build_v3_adk_composite_prompt(persona_set, netlogo_code_content, len(encoded_images))
+        fileio.write_input_instructions_before_api(output_dir, system_prompt)
+
+        custom_id = f"{case}_{persona_set}"
+        output_dirs[custom_id] = output_dir
+        requests.append({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/responses",
+            "body": {
+                "model": model,
+                "instructions": system_prompt,
+                "input": build_minimal_api_input(input_contents),
+            },
+        })
+
+    client = create_openai_client()
+    batch = openai_client.submit_batch(client, requests)
+    logger.info("Submitted batch %s with %d requests", batch.id, len(requests))
+
+    batch = openai_client.wait_for_batch(client, batch.id)
+    status = getattr(batch, "status", None)
+    if status != "completed":
+        logger.error("Batch %s ended with status: %s", batch.id, status)
+        return False
+
+    ok = True
+    for result in openai_client.iter_batch_results(client, batch):
+        custom_id = result.get("custom_id")
+        output_dir = output_dirs.get(custom_id)
+        if output_dir is None:
+            logger.warning("Unknown custom_id in batch results: %s", custom_id)
+            continue
+        body = (result.get("response") or {}).get("body") or {}
+        _write_raw_response_json(os.path.join(output_dir, "raw_response.json"), body)
+        output_text = _batch_output_text(body)
+        if output_text:
+            fileio.write_file_content(os.path.join(output_dir, "output_full_text.md"), output_text)
+            # The composite prompt requests the same 3-stage JSON envelope as
+            # the single-call path, so the responses go through the same
+            # parse-and-save pipeline.
+            parsed_artifacts = _parse_single_call_response(output_text, logger)
+            _save_stage_artifacts(parsed_artifacts, output_dir, logger)
         else:
-            logger.info(f"Artifact not found in output: {name}")
+            logger.warning("No output text in batch result for %s", custom_id)
+            ok = False
+    return ok
 
 def main():
     """
@@ -99,10 +756,45 @@ def main():
     parser.add_argument("--reasoning", type=str, choices=["minimal", "low", "medium", "high"], help="Reasoning effort.")
     parser.add_argument("--verbosity", type=str, choices=["low", "medium", "high"], help="Text verbosity.")
     parser.add_argument("--non-interactive", action="store_true", help="Run without interactive prompts.")
+    parser.add_argument("--cases", type=str, help="Comma-separated list of NetLogo cases to run concurrently.")
+    parser.add_argument("--max-concurrency", type=int, default=4, help="Maximum concurrent runs in --cases mode.")
+    parser.add_argument("--batch", action="store_true", help="Submit --cases through the OpenAI Batch API (24h SLA, 50%% cost).")
+    parser.add_argument("--cache", action="store_true", help="Reuse cached responses for identical prompt/model/reasoning/verbosity runs.")
 
     args = parser.parse_args()
 
-    run_name = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Batch API mode: non-interactive bulk submission with a 24h completion window
+    if args.batch:
+        cases = [case.strip() for case in (args.cases or "").split(",") if case.strip()]
+        cases = cases or fileio.get_netlogo_cases()
+        if not cases:
+            print("No NetLogo cases found for --batch mode.")
+            sys.exit(1)
+        ok = run_batch_api(
+            cases,
+            persona_set=args.persona_set or cfg.DEFAULT_PERSONA_SET,
+            model=args.model or "gpt-5-nano-2025-08-07",
+            reasoning=args.reasoning or "medium",
+            verbosity=args.verbosity or "medium",
+        )
+        sys.exit(0 if ok else 1)
+
+    # Concurrent real-time mode: fan several cases out, one run per case
+    if args.cases:
+        cases = [case.strip() for case in args.cases.split(",") if case.strip()]
+        if not cases:
+            print("No cases given to --cases.")
+            sys.exit(1)
+        ok = main_batch(
+            cases,
+            persona_set=args.persona_set or cfg.DEFAULT_PERSONA_SET,
+            model=args.model or "gpt-5-nano-2025-08-07",
+            reasoning=args.reasoning or "medium",
+            verbosity=args.verbosity or "medium",
+            max_concurrency=args.max_concurrency,
+            use_cache=args.cache,
+        )
+        sys.exit(0 if ok else 1)
 
     # Selections will be populated either by args or interactive prompts
     selected_case = args.case
@@ -137,6 +829,13 @@ def main():
             print("No NetLogo cases found. Please check the input directory.")
             sys.exit(1)
 
+    run_agent(selected_case, selected_persona_set, selected_model, selected_reasoning, selected_verbosity,
+              use_cache=args.cache)
+
+def run_agent(selected_case, selected_persona_set, selected_model, selected_reasoning, selected_verbosity, use_cache=False):
+    """Run the full single-call pipeline for one case/parameter combination."""
+    run_name = time.strftime("%Y%m%d_%H%M%S")
+
     # Setup logging after all parameters are determined
     logger = log.setup_run_logger(
         base_name=selected_case,
@@ -147,72 +846,104 @@ def main():
         persona_set=selected_persona_set
     )
 
-    logger.info(f"--- Starting Agent Run: {run_name} ---")
-    logger.info(f"=== SINGLE-CALL MODE: v3 ADK Compatible ===")
-    logger.info(f"Selected Case: {selected_case}")
-    logger.info(f"Selected Persona Set: {selected_persona_set}")
-    logger.info(f"Selected Model: {selected_model}")
-    logger.info(f"Selected Reasoning: {selected_reasoning}")
-    logger.info(f"Selected Verbosity: {selected_verbosity}")
+    logger.info("--- Starting Agent Run: %s ---", run_name)
+    logger.info("=== SINGLE-CALL MODE: v3 ADK Compatible ===")
+    logger.info("Selected Case: %s", selected_case)
+    logger.info("Selected Persona Set: %s", selected_persona_set)
+    logger.info("Selected Model: %s", selected_model)
+    logger.info("Selected Reasoning: %s", selected_reasoning)
+    logger.info("Selected Verbosity: %s", selected_verbosity)
 
     # Check API key presence for the selected model (no validation)
     try:
-        from utils_api_key import get_provider_for_model, get_api_key_for_model
         provider = get_provider_for_model(selected_model)
-        logger.info(f"Detected provider: {provider} for model: {selected_model}")
+        logger.info("Detected provider: %s for model: %s", provider, selected_model)
         _ = get_api_key_for_model(selected_model)
-        logger.info(f"✓ API key found for provider: {provider}")
+        logger.info("✓ API key found for provider: %s", provider)
     except Exception as e:
-        logger.error(f"Missing API key for selected model/provider: {e}", exc_info=True)
+        logger.error("Missing API key for selected model/provider: %s", e, exc_info=True)
         sys.exit(1)
 
+    # Fail fast on providers the single agent cannot serve: rejecting here
+    # skips the persona reads, prompt building and output writes that would
+    # otherwise all happen before the API-client selection noticed.
+    if provider in ("gemini", "router"):
+        model_lower = selected_model.lower()
+        if provider == "gemini":
+            model_type = "Gemini"
+        elif "mistral" in model_lower:
+            model_type = "Mistral"
+        elif "llama" in model_lower:
+            model_type = "Llama"
+        else:
+            model_type = "OpenRouter"
+        logger.error(
+            "%s models are not yet fully supported in the single agent "
+            "(only the OpenAI Responses API is wired up). Please use the "
+            "orchestrator with ADK (orchestrator_persona_v3_adk.py) for "
+            "%s model support, or use an OpenAI model instead.",
+            model_type, model_type,
+        )
+        sys.exit(2)
+
     # --- 1. Create Output Directory ---
     output_dir = fileio.create_run_output_directory(
         run_name, selected_case, selected_model, selected_persona_set,
         reasoning=selected_reasoning, verbosity=selected_verbosity
     )
-    logger.info(f"Created output directory: {output_dir}")
+    logger.info("Created output directory: %s", output_dir)
 
     # --- 2. Load Input Files ---
     logger.info("Loading input files...")
     try:
-        # Load NetLogo code
-        netlogo_code_content = fileio.read_netlogo_case_content(selected_case)
-        logger.info(f"Successfully loaded NetLogo case: {selected_case}")
-
-        # Load all persona and DSL files
+        # All input loading is blocking disk I/O, so fan it out on a thread
+        # pool: submit everything first, then collect the results.
         persona_path = os.path.join(cfg.INPUT_PERSONA_DIR, selected_persona_set)
-        all_persona_files = fileio.find_files(persona_path, ".md")
 
-        input_contents = {
-            "netlogo_code": netlogo_code_content
-        }
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            netlogo_future = executor.submit(fileio.read_netlogo_case_content, selected_case)
+            images_future = executor.submit(fileio.load_and_encode_images, selected_case, logger)
+            # Cached bundle: repeat runs on the same persona set skip the disk reads
+            persona_future = executor.submit(fileio.load_persona_bundle, persona_path)
+            # The mandatory task file is independent of the other inputs, so
+            # its read rides the same pool instead of running serially after it
+            task_file_path = _task_dir_index().get("single-agent-task")
+            task_future = executor.submit(fileio.read_file_content, task_file_path) if task_file_path else None
 
-        for file_path in all_persona_files:
-            file_name = os.path.basename(file_path)
-            content = fileio.read_file_content(file_path)
-            input_contents[file_name] = content
-            logger.info(f"Loaded input file: {file_name}")
+            netlogo_code_content = netlogo_future.result()
+            logger.info("Successfully loaded NetLogo case: %s", selected_case)
+
+            input_contents = {
+                "netlogo_code": netlogo_code_content
+            }
 
-        # Load NetLogo interface images as base64 strings
-        encoded_images = fileio.load_and_encode_images(selected_case, logger)
-        if encoded_images:
-            input_contents["netlogo_images"] = encoded_images
+            for file_name, content in persona_future.result():
+                input_contents[file_name] = content
+                logger.info("Loaded input file: %s", file_name)
 
-        # Load task instructions from single-agent-task file
+            # Load NetLogo interface images as base64 strings
+            encoded_images = images_future.result()
+            if encoded_images:
+                input_contents["netlogo_images"] = encoded_images
+                # map(len, ...) reports sizes without copying any payload
+                logger.info(
+                    "Loaded %d NetLogo interface images (%d total base64 chars)",
+                    len(encoded_images), sum(map(len, encoded_images))
+                )
+
+        # Collect task instructions from the single-agent-task future
         task_instructions = None
         try:
-            task_file_path = os.path.join(project_root, "input-task", "single-agent-task")
-            if os.path.exists(task_file_path):
-                task_instructions = fileio.read_file_content(task_file_path)
+            if task_future is not None:
+                task_instructions = task_future.result()
                 logger.info("Successfully loaded task instructions from single-agent-task")
             else:
                 logger.error("Mandatory TASK instructions file not found at input-task/single-agent-task")
         except Exception as e:
-            logger.error(f"Failed to load task instructions: {e}")
+            logger.error("Failed to load task instructions: %s", e)
 
     except Exception as e:
-        logger.error(f"Failed to load input files: {e}", exc_info=True)
+        logger.error("Failed to load input files: %s", e, exc_info=True)
         sys.exit(1)
 
     # --- 2. Build the complete system prompt ---
@@ -224,502 +955,168 @@ def main():
         logger.error("Mandatory TASK instructions are missing. Expected file at input-task/single-agent-task. Aborting.")
         sys.exit(2)
 
-    # Build system prompt with an explicit, multi-agent-aligned order
-    def _safe_read(path: str) -> str:
-        try:
-            return fileio.read_file_content(path) if path and os.path.exists(path) else ""
-        except Exception:
-            return ""
-
-    def _load_step_task(step_index: int) -> str:
-        """Load the per-stage task content from input-task/step-<n>-task as a single line.
-        Returns an empty string if the file is missing or unreadable.
-        """
-        try:
-            step_fname = f"step-{step_index}-task"
-            step_path = os.path.join(project_root, "input-task", step_fname)
-            if os.path.exists(step_path):
-                content = fileio.read_file_content(step_path).strip()
-                # Remove optional <TASK> wrappers if present
-                content = re.sub(r"</?TASK>", "", content)
-                # Normalize whitespace to keep it on a single line for compact prompts
-                one_line = re.sub(r"\s+", " ", content).strip()
-                return one_line
-        except Exception:
-            pass
-        return ""
-
-    def _load_step_2a_task() -> str:
-        """Load the per-stage task content from input-task/step-2a-task as a single line.
-        Returns an empty string if the file is missing or unreadable.
-        """
-        try:
-            step_path = os.path.join(project_root, "input-task", "step-2a-task")
-            if os.path.exists(step_path):
-                content = fileio.read_file_content(step_path).strip()
-                content = re.sub(r"</?TASK>", "", content)
-                one_line = re.sub(r"\s+", " ", content).strip()
-                return one_line
-        except Exception:
-            pass
-        return ""
-
-    def _inject_stage_tasks_into_task_instructions(text: str) -> str:
-        """Insert a 'Task: <content>' line just before the '- Persona:' line for each stage (1..8).
-        The insertion preserves indentation and does not modify existing lines.
-        """
-        if not text:
-            return text
-
-        updated = text
-        for step_idx in range(1, 9):
-            step_task = _load_step_task(step_idx)
-            if not step_task:
-                continue  # Skip insertion if no task file
-
-            # Pattern: find the stage header line, then the first '- Persona:' line following it
-            # Capture the indentation used by the Persona bullet to reuse for the Task line
-            pattern = (
-                rf"(\n\s*{step_idx}\)\s[^\n]*\n)(\s*-\s*Persona:)"
-            )
-
-            def _repl(match: re.Match) -> str:
-                header = match.group(1)
-                persona_marker = match.group(2)
-                indent_match = re.match(r"(\s*)-\s*Persona:", persona_marker)
-                indent = indent_match.group(1) if indent_match else "   "
-                task_line = f"{indent}- Task: {step_task}\n"
-                return f"{header}{task_line}{persona_marker}"
-
-            # Only replace the first occurrence for each stage to avoid multiple insertions
-            updated = re.sub(pattern, _repl, updated, count=1, flags=re.MULTILINE)
-
-        return updated
-
-    # Build v3 ADK-compatible composite prompt for single-call mode
-    def _build_v3_adk_composite_prompt():
-        """Build a composite prompt that requests all 3 stages in a single LLM call."""
-        ordered_blocks = []
-        
-        # Load v3 ADK personas and rules
-        persona_dir = cfg.INPUT_PERSONA_DIR / selected_persona_set
-        
-        # Stage 1: LUCIM Operation Model Generator
-        persona_op_model = _safe_read(str(persona_dir / "PSN_LUCIM_Operation_Model_Generator.md"))
-        if persona_op_model:
-            ordered_blocks.append("=== STAGE 1: LUCIM OPERATION MODEL GENERATION ===")
-            ordered_blocks.append(persona_op_model)
-        
-        # Load NetLogo to LUCIM mapping
-        mapping_file = persona_dir / "RULES_MAPPING_NETLOGO_TO_OPERATION_MODEL.md"
-        netlogo_mapping = _safe_read(str(mapping_file))
-        if netlogo_mapping:
-            ordered_blocks.append(f"<NETLOGO-TO-LUCIM-MAPPING>\n{netlogo_mapping}\n</NETLOGO-TO-LUCIM-MAPPING>")
-        
-        # Load LUCIM Operation Model rules
-        rules_op_model = _safe_read(str(persona_dir / "RULES_LUCIM_Operation_model.md"))
-        if rules_op_model:
-            ordered_blocks.append(f"<LUCIM-OPERATION-MODEL-RULES>\n{rules_op_model}\n</LUCIM-OPERATION-MODEL-RULES>")
-        
-        # Stage 2: LUCIM Scenario Generator
-        persona_scenario = _safe_read(str(persona_dir / "PSN_LUCIM_Scenario_Generator.md"))
-        if persona_scenario:
-            ordered_blocks.append("\n=== STAGE 2: LUCIM SCENARIO GENERATION ===")
-            ordered_blocks.append(persona_scenario)
-        
-        # Load Scenario rules
-        rules_scenario = _safe_read(str(persona_dir / "RULES_LUCIM_Scenario.md"))
-        if rules_scenario:
-            ordered_blocks.append(f"<LUCIM-SCENARIO-RULES>\n{rules_scenario}\n</LUCIM-SCENARIO-RULES>")
-        
-        # Stage 3: LUCIM PlantUML Diagram Generator
-        persona_plantuml = _safe_read(str(persona_dir / "PSN_LUCIM_PlantUML_Diagram_Generator.md"))
-        if persona_plantuml:
-            ordered_blocks.append("\n=== STAGE 3: LUCIM PLANTUML DIAGRAM GENERATION ===")
-            ordered_blocks.append(persona_plantuml)
-        
-        # Load PlantUML Diagram rules
-        rules_plantuml = _safe_read(str(persona_dir / "RULES_LUCIM_PlantUML_Diagram.md"))
-        if rules_plantuml:
-            ordered_blocks.append(f"<LUCIM-PLANTUML-DIAGRAM-RULES>\n{rules_plantuml}\n</LUCIM-PLANTUML-DIAGRAM-RULES>")
-        
-        # Add NetLogo source code
-        ordered_blocks.append(f"\n<NETLOGO-SOURCE-CODE>\n{netlogo_code_content}\n</NETLOGO-SOURCE-CODE>")
-        if "netlogo_images" in input_contents and input_contents["netlogo_images"]:
-            ordered_blocks.append(
-                f"<NETLOGO-INTERFACE-IMAGES>\ncount={len(input_contents['netlogo_images'])}\n</NETLOGO-INTERFACE-IMAGES>"
-            )
-        
-        # Add output format instructions for structured response
-        output_format = """
-=== OUTPUT FORMAT REQUIREMENTS ===
-
-You must produce a single JSON response with the following structure:
-
-{
-  "operation_model": {
-    "data": <LUCIM Operation Model JSON object>,
-    "errors": []
-  },
-  "scenario": {
-    "data": {
-      "scenario": {
-        "name": "<scenario name>",
-        "description": "<scenario description>",
-        "messages": [<array of scenario messages>]
-      }
-    },
-    "errors": []
-  },
-  "plantuml_diagram": {
-    "data": {
-      "plantuml-diagram": "<PlantUML diagram text between @startuml and @enduml>"
-    },
-    "errors": []
-  }
-}
-
-CRITICAL: 
-- The operation_model.data must be a valid JSON object (no Markdown fences, no text outside JSON)
-- The scenario.data must follow the LUCIM Scenario JSON format
-- The plantuml_diagram.data["plantuml-diagram"] must contain the complete PlantUML diagram text (including @startuml and @enduml markers, no Markdown fences)
-- All three stages must be completed in this single response
-"""
-        ordered_blocks.append(output_format)
-        
-        return "\n\n".join([b for b in ordered_blocks if b and str(b).strip()])
-    
     # Build the composite prompt
-    system_prompt = _build_v3_adk_composite_prompt()
+    system_prompt = _build_v3_adk_composite_prompt(
+        selected_persona_set, netlogo_code_content, len(input_contents.get("netlogo_images") or [])
+    )
 
-    # Write input-instructions.md BEFORE API call for debugging
-    fileio.write_input_instructions_before_api(output_dir, system_prompt)
+    # Write input-instructions.md BEFORE API call for debugging. The write is
+    # independent of the request, so flush it on a background thread; the
+    # network round-trip dwarfs the disk write, and the non-daemon thread
+    # guarantees the file lands even if the API call fails.
+    instructions_writer = threading.Thread(
+        target=fileio.write_input_instructions_before_api,
+        args=(output_dir, system_prompt),
+        daemon=False,
+    )
+    instructions_writer.start()
 
     # --- 3. Call the AI model ---
-    import time
     run_start = time.time()
-    logger.info(f"Sending request to AI model: {selected_model}...")
+    logger.info("Sending request to AI model: %s...", selected_model)
     try:
-        from utils_api_key import get_provider_for_model, create_openai_client, get_gemini_api_key
-        from utils_openai_client import get_openai_client
-        
-        provider = get_provider_for_model(selected_model)
-        
-        # Detect specific model families for better error messages
-        model_lower = selected_model.lower()
-        is_mistral = "mistral" in model_lower
-        is_llama = "llama" in model_lower
-        
-        if provider == "gemini":
-            # For Gemini models, we need to use Google's API
-            # Note: The single agent currently only supports OpenAI Responses API
-            # This is a limitation that should be addressed in a future update
-            logger.error(
-                f"Gemini models are not yet fully supported in the single agent. "
-                f"Please use the orchestrator with ADK (orchestrator_persona_v3_adk.py) "
-                f"for Gemini model support, or use an OpenAI model instead."
-            )
-            raise ValueError(
-                f"Gemini provider detected but single agent only supports OpenAI Responses API. "
-                f"Model: {selected_model}, Provider: {provider}"
-            )
-        elif provider == "router":
-            # For OpenRouter models (Mistral, Llama, etc.), we need to use OpenRouter API
-            model_type = ""
-            if is_mistral:
-                model_type = "Mistral"
-            elif is_llama:
-                model_type = "Llama"
-            else:
-                model_type = "OpenRouter"
-            
-            logger.error(
-                f"{model_type} models (via OpenRouter) are not yet fully supported in the single agent. "
-                f"Please use the orchestrator with ADK (orchestrator_persona_v3_adk.py) "
-                f"for {model_type} model support, or use an OpenAI model instead."
-            )
-            raise ValueError(
-                f"OpenRouter provider detected ({model_type} model) but single agent only supports OpenAI Responses API. "
-                f"Model: {selected_model}, Provider: {provider}"
-            )
-        else:
-            # OpenAI provider - use standard OpenAI client
-            client = get_openai_client()
+        # Unsupported providers were rejected right after provider detection,
+        # so this is always the OpenAI Responses API path.
+        client = create_openai_client()
 
-        # Define API configuration for the Responses API
+        # Define API configuration for the Responses API.
+        # The composite prompt goes through 'instructions' only; the 'input'
+        # message is a short directive plus the structured input_image
+        # entries, so neither the prompt text nor the base64 payload is
+        # uploaded (and billed) a second time.
+        api_input = build_minimal_api_input(input_contents)
         api_config = {
             "model": selected_model,
             "instructions": system_prompt,
-            "input": [{"role": "user", "content": [{"type": "input_text", "text": system_prompt}]}],
+            "input": api_input,
         }
 
-        # Call the API and wait for the response
-        response = openai_client.create_and_wait(client, api_config)
+        # Optional content-addressed cache: the response is a deterministic
+        # function of the prompt plus the model/reasoning/verbosity knobs, so
+        # a rerun of the same combination can skip the network round-trip.
+        cache_path = None
+        response = None
+        if use_cache:
+            cache_path = _response_cache_path(
+                selected_model, selected_reasoning, selected_verbosity, system_prompt
+            )
+            response = _load_cached_response(cache_path)
+            if response is not None:
+                logger.info("✓ Using cached response: %s", cache_path)
 
-        # Log token usage
-        usage = openai_client.get_usage_tokens(response)
+        if response is None:
+            # Call the API and wait for the response, pacing under the rate limits
+            estimated_tokens = len(system_prompt) // 4
+            _RATE_LIMITER.acquire(estimated_tokens=estimated_tokens)
+            response = openai_client.create_and_wait(client, api_config)
+            if cache_path:
+                _write_raw_response_json(cache_path, response.to_dict())
+                logger.info("Cached response for reuse: %s", cache_path)
+
+            # Reconcile the limiter with the real consumption
+            usage = openai_client.get_usage_tokens(response)
+            _RATE_LIMITER.record_usage(estimated_tokens, usage["total_tokens"])
+        else:
+            usage = openai_client.get_usage_tokens(response)
         logger.info(
             f"Single-call API completed successfully. Token usage: "
             f"Input: {usage['input_tokens']}, Output: {usage['output_tokens']}, Total: {usage['total_tokens']}"
         )
-        logger.info(f"Single-call mode: Exactly 1 LLM call performed for all 3 stages")
+        logger.info("Single-call mode: Exactly 1 LLM call performed for all 3 stages")
 
     except Exception as e:
-        logger.error(f"API call failed: {e}", exc_info=True)
+        logger.error("API call failed: %s", e, exc_info=True)
         sys.exit(1)
 
     # --- 4. Process and save the output artifacts (SINGLE-CALL MODE) ---
     logger.info("Processing single-call response and extracting 3-stage artifacts...")
     try:
-        import json
-        from pathlib import Path
-        
-        # Save the raw API response
-        raw_response_dict = response.to_dict()
-        fileio.write_json(os.path.join(output_dir, "raw_response.json"), raw_response_dict)
-        
-        # Extract and save the main text content
+        # Extract the main text content
         output_text = openai_client.get_output_text(response)
-        if output_text:
-            fileio.write_file_content(os.path.join(output_dir, "output_full_text.md"), output_text)
-            logger.info("Saved full text output.")
-        
-        # Parse the structured JSON response to extract 3 artifacts
-        def _parse_single_call_response(response_text: str) -> dict:
-            """Parse the single-call response to extract operation model, scenario, and PlantUML."""
-            artifacts = {
-                "operation_model": None,
-                "scenario": None,
-                "plantuml_diagram": None
-            }
-            
-            if not response_text or not isinstance(response_text, str):
-                logger.error("Response text is empty or invalid")
-                return artifacts
-            
-            try:
-                # Try to parse as JSON first
-                # Look for JSON block in the response (handle markdown code fences)
-                json_text = response_text
-                
-                # Remove markdown code fences if present
-                if "```json" in json_text:
-                    start = json_text.find("```json") + 7
-                    end = json_text.find("```", start)
-                    if end > start:
-                        json_text = json_text[start:end].strip()
-                elif "```" in json_text:
-                    start = json_text.find("```") + 3
-                    end = json_text.find("```", start)
-                    if end > start:
-                        json_text = json_text[start:end].strip()
-                
-                # Find JSON boundaries
-                json_start = json_text.find("{")
-                json_end = json_text.rfind("}") + 1
-                
-                if json_start >= 0 and json_end > json_start:
-                    json_content = json_text[json_start:json_end]
-                    parsed = json.loads(json_content)
-                    
-                    # Schema validation: check for required top-level keys
-                    required_keys = ["operation_model", "scenario", "plantuml_diagram"]
-                    missing_keys = [k for k in required_keys if k not in parsed]
-                    if missing_keys:
-                        logger.warning(f"Missing required keys in response: {missing_keys}")
-                    
-                    # Extract operation model with schema guard
-                    if "operation_model" in parsed:
-                        op_model = parsed["operation_model"]
-                        if isinstance(op_model, dict) and "data" in op_model:
-                            artifacts["operation_model"] = op_model
-                        else:
-                            logger.warning("operation_model missing 'data' key or invalid structure")
-                    
-                    # Extract scenario with schema guard
-                    if "scenario" in parsed:
-                        scenario = parsed["scenario"]
-                        if isinstance(scenario, dict) and "data" in scenario:
-                            artifacts["scenario"] = scenario
-                        else:
-                            logger.warning("scenario missing 'data' key or invalid structure")
-                    
-                    # Extract PlantUML diagram with schema guard
-                    if "plantuml_diagram" in parsed:
-                        puml = parsed["plantuml_diagram"]
-                        if isinstance(puml, dict) and "data" in puml:
-                            puml_data = puml["data"]
-                            if isinstance(puml_data, dict) and "plantuml-diagram" in puml_data:
-                                artifacts["plantuml_diagram"] = puml
-                            else:
-                                logger.warning("plantuml_diagram.data missing 'plantuml-diagram' key")
-                        else:
-                            logger.warning("plantuml_diagram missing 'data' key or invalid structure")
-                    
-                    logger.info("Successfully parsed structured JSON response with schema validation.")
-                    return artifacts
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                logger.warning(f"Failed to parse structured JSON response: {e}")
-            
-            # Fallback: try to extract from text patterns
-            logger.info("Attempting fallback extraction from text patterns...")
-            
-            # Try to extract PlantUML (look for @startuml...@enduml)
-            plantuml_start = response_text.find("@startuml")
-            plantuml_end = response_text.find("@enduml")
-            if plantuml_start >= 0 and plantuml_end > plantuml_start:
-                plantuml_text = response_text[plantuml_start:plantuml_end + len("@enduml")]
-                artifacts["plantuml_diagram"] = {
-                    "data": {"plantuml-diagram": plantuml_text},
-                    "errors": []
-                }
-                logger.info("Extracted PlantUML diagram from text patterns.")
-            
-            return artifacts
-        
-        # Parse the response
-        parsed_artifacts = _parse_single_call_response(output_text if output_text else "")
-        
-        # Create stage directories (matching v3 ADK structure)
-        stage1_dir = os.path.join(output_dir, "1_lucim_operation_model", "iter-1", "1-generator")
-        stage2_dir = os.path.join(output_dir, "2_lucim_scenario", "iter-1", "1-generator")
-        stage3_dir = os.path.join(output_dir, "3_lucim_plantuml_diagram", "iter-1", "1-generator")
-        
-        os.makedirs(stage1_dir, exist_ok=True)
-        os.makedirs(stage2_dir, exist_ok=True)
-        os.makedirs(stage3_dir, exist_ok=True)
-        
-        # Save Stage 1: Operation Model
-        if parsed_artifacts["operation_model"]:
-            op_model_data = parsed_artifacts["operation_model"].get("data")
-            if op_model_data:
-                # Save as JSON (raw text content)
-                if isinstance(op_model_data, dict):
-                    op_model_text = json.dumps(op_model_data, indent=2, ensure_ascii=False)
-                else:
-                    op_model_text = str(op_model_data)
-                fileio.write_file_content(os.path.join(stage1_dir, "output-data.json"), op_model_text)
-                logger.info("Saved operation model to Stage 1 directory.")
-        
-        # Save Stage 2: Scenario
-        if parsed_artifacts["scenario"]:
-            scenario_data = parsed_artifacts["scenario"].get("data")
-            if scenario_data:
-                # Save as JSON (raw text content)
-                if isinstance(scenario_data, dict):
-                    scenario_text = json.dumps(scenario_data, indent=2, ensure_ascii=False)
-                else:
-                    scenario_text = str(scenario_data)
-                fileio.write_file_content(os.path.join(stage2_dir, "output-data.json"), scenario_text)
-                logger.info("Saved scenario to Stage 2 directory.")
-        
-        # Save Stage 3: PlantUML Diagram
-        if parsed_artifacts["plantuml_diagram"]:
-            puml_data = parsed_artifacts["plantuml_diagram"].get("data", {})
-            if isinstance(puml_data, dict) and "plantuml-diagram" in puml_data:
-                puml_text = puml_data["plantuml-diagram"]
-                # Save as .puml file
-                fileio.write_file_content(os.path.join(stage3_dir, "diagram.puml"), puml_text)
-                # Also save as output-data.json (raw text)
-                fileio.write_file_content(os.path.join(stage3_dir, "output-data.json"), puml_text)
-                logger.info("Saved PlantUML diagram to Stage 3 directory.")
-        
+
+        # Save the raw API response and the full text on worker threads while
+        # the main thread parses; both saves are independent of the parse, so
+        # wall time becomes max(serialize+write, parse) instead of the sum.
+        out_prefix = os.fspath(output_dir).rstrip(os.sep) + os.sep
+        with ThreadPoolExecutor(max_workers=2) as writer_pool:
+            writer_pool.submit(_write_raw_response_json, f"{out_prefix}raw_response.json", response.to_dict())
+            if output_text:
+                writer_pool.submit(fileio.write_file_content, f"{out_prefix}output_full_text.md", output_text)
+                logger.info("Saved full text output.")
+
+            # Parse the response
+            parsed_artifacts = _parse_single_call_response(output_text if output_text else "", logger)
+
+        # Create the stage directories (matching v3 ADK structure) and save
+        # the three artifacts; the returned texts are reused by the audit
+        # section below instead of re-encoding the same dicts.
+        op_model_text, scenario_text = _save_stage_artifacts(parsed_artifacts, output_dir, logger)
+
         # --- 5. Run deterministic audits (no LLM calls) ---
         logger.info("Running deterministic audits on extracted artifacts...")
         try:
-            # Import deterministic auditors
-            from utils_audit_operation_model import audit_operation_model
-            from utils_audit_scenario import audit_scenario
-            from utils_audit_diagram import audit_diagram
-            
+            op_model_for_audit = parsed_artifacts["operation_model"].get("data") if parsed_artifacts["operation_model"] else None
+            scenario_for_audit = parsed_artifacts["scenario"].get("data") if parsed_artifacts["scenario"] else None
+
+            # Collect (stage subdir, payload) pairs first; one loop below then
+            # creates the auditor directories and emits the JSON writes together.
+            audit_outputs = []
+
             # Audit Stage 1: Operation Model
-            if parsed_artifacts["operation_model"]:
-                op_model_data = parsed_artifacts["operation_model"].get("data")
-                if op_model_data and isinstance(op_model_data, dict):
-                    op_model_raw = json.dumps(op_model_data, indent=2, ensure_ascii=False)
-                    audit_result = audit_operation_model(op_model_data, op_model_raw)
-                    
-                    # Save audit result
-                    audit_dir = os.path.join(output_dir, "1_lucim_operation_model", "iter-1", "2-auditor")
-                    os.makedirs(audit_dir, exist_ok=True)
-                    
-                    # Format audit result as output-data.json (plain text)
-                    audit_text = json.dumps({
-                        "verdict": "compliant" if audit_result.get("verdict") else "non-compliant",
-                        "non-compliant-rules": [v.get("id") for v in audit_result.get("violations", [])],
-                        "violations": audit_result.get("violations", [])
-                    }, indent=2, ensure_ascii=False)
-                    fileio.write_file_content(os.path.join(audit_dir, "output-data.json"), audit_text)
-                    logger.info(f"Operation Model audit: {'COMPLIANT' if audit_result.get('verdict') else 'NON-COMPLIANT'}")
-            
-            # Audit Stage 2: Scenario
-            if parsed_artifacts["scenario"]:
-                scenario_data = parsed_artifacts["scenario"].get("data")
-                if scenario_data:
-                    scenario_raw = json.dumps(scenario_data, indent=2, ensure_ascii=False) if isinstance(scenario_data, dict) else str(scenario_data)
-                    # Pass operation model for scenario audit if available
-                    op_model_for_audit = parsed_artifacts["operation_model"].get("data") if parsed_artifacts["operation_model"] else None
-                    audit_result = audit_scenario(scenario_data, scenario_raw, operation_model=op_model_for_audit)
-                    
-                    # Save audit result
-                    audit_dir = os.path.join(output_dir, "2_lucim_scenario", "iter-1", "2-auditor")
-                    os.makedirs(audit_dir, exist_ok=True)
-                    
-                    audit_text = json.dumps({
-                        "verdict": "compliant" if audit_result.get("verdict") else "non-compliant",
-                        "non-compliant-rules": [v.get("id") for v in audit_result.get("violations", [])],
-                        "violations": audit_result.get("violations", [])
-                    }, indent=2, ensure_ascii=False)
-                    fileio.write_file_content(os.path.join(audit_dir, "output-data.json"), audit_text)
-                    logger.info(f"Scenario audit: {'COMPLIANT' if audit_result.get('verdict') else 'NON-COMPLIANT'}")
-            
-            # Audit Stage 3: PlantUML Diagram
+            if op_model_for_audit and isinstance(op_model_for_audit, dict):
+                op_model_raw = op_model_text if op_model_text is not None else _dumps_json_text(op_model_for_audit)
+                audit_result = audit_operation_model(op_model_for_audit, op_model_raw)
+                audit_outputs.append(("1_lucim_operation_model", _verdict_payload(audit_result)))
+                logger.info("Operation Model audit: %s", 'COMPLIANT' if audit_result.get('verdict') else 'NON-COMPLIANT')
+
+            # Audit Stage 2: Scenario (the operation model is passed along when available)
+            if scenario_for_audit:
+                scenario_raw = scenario_text if scenario_text is not None else (
+                    _dumps_json_text(scenario_for_audit) if isinstance(scenario_for_audit, dict) else str(scenario_for_audit)
+                )
+                audit_result = audit_scenario(scenario_for_audit, scenario_raw, operation_model=op_model_for_audit)
+                audit_outputs.append(("2_lucim_scenario", _verdict_payload(audit_result)))
+                logger.info("Scenario audit: %s", 'COMPLIANT' if audit_result.get('verdict') else 'NON-COMPLIANT')
+
+            # Audit Stage 3: PlantUML Diagram (already in the orchestrator format)
             if parsed_artifacts["plantuml_diagram"]:
                 puml_data = parsed_artifacts["plantuml_diagram"].get("data", {})
                 if isinstance(puml_data, dict) and "plantuml-diagram" in puml_data:
                     puml_text = puml_data["plantuml-diagram"]
-                    puml_raw = puml_text
-                    
-                    # Pass operation model and scenario for diagram audit
-                    op_model_for_audit = parsed_artifacts["operation_model"].get("data") if parsed_artifacts["operation_model"] else None
-                    scenario_for_audit = parsed_artifacts["scenario"].get("data") if parsed_artifacts["scenario"] else None
-                    
                     audit_result = audit_diagram(
                         puml_text,
-                        puml_raw,
+                        puml_text,
                         svg_path=None,  # No SVG validation in single-call mode
                         operation_model=op_model_for_audit,
                         scenario=scenario_for_audit
                     )
-                    
-                    # Save audit result
-                    audit_dir = os.path.join(output_dir, "3_lucim_plantuml_diagram", "iter-1", "2-auditor")
-                    os.makedirs(audit_dir, exist_ok=True)
-                    
-                    # Format matches orchestrator format
                     audit_data = audit_result.get("data", {})
-                    audit_text = json.dumps(audit_data, indent=2, ensure_ascii=False)
-                    fileio.write_file_content(os.path.join(audit_dir, "output-data.json"), audit_text)
-                    logger.info(f"PlantUML Diagram audit: {audit_data.get('verdict', 'unknown').upper()}")
-        
+                    audit_outputs.append(("3_lucim_plantuml_diagram", audit_data))
+                    logger.info("PlantUML Diagram audit: %s", audit_data.get('verdict', 'unknown').upper())
+
+            # Save audit results (the auditor directories were created with
+            # the generator stage directories above)
+            for stage_subdir, payload in audit_outputs:
+                audit_dir = os.path.join(f"{out_prefix}{stage_subdir}", "iter-1", "2-auditor")
+                _write_json_payload(os.path.join(audit_dir, "output-data.json"), payload)
+
         except Exception as audit_error:
-            logger.error(f"Error during deterministic audits: {audit_error}", exc_info=True)
+            logger.error("Error during deterministic audits: %s", audit_error, exc_info=True)
             # Continue execution even if audits fail
 
     except Exception as e:
-        logger.error(f"Failed to process or save outputs: {e}", exc_info=True)
+        logger.error("Failed to process or save outputs: %s", e, exc_info=True)
         sys.exit(1)
 
     # --- 5. Build and print OVERALL SUMMARY ---
-    from utils_run_logging import OrchestratorLogger
     run_end = time.time()
     # Detect artifacts that we created in this run directory
     try:
-        artifacts = []
-        for fname in os.listdir(output_dir):
-            if fname.endswith((".json", ".md", ".puml")):
-                artifacts.append(fname)
-        artifacts.sort()
+        with os.scandir(output_dir) as entries:
+            artifacts = sorted(
+                entry.name for entry in entries
+                if entry.is_file() and entry.name.endswith((".json", ".md", ".puml"))
+            )
     except Exception:
         artifacts = []
 
@@ -742,9 +1139,46 @@ CRITICAL:
     try:
         ol.persist_overall_summary(output_dir, summary_text)
     except Exception as e:
-        logger.warning(f"Could not persist overall summary: {e}")
+        logger.warning("Could not persist overall summary: %s", e)
 
-    logger.info(f"--- Agent Run Finished: {run_name} (Single-Call Mode) ---")
+    logger.info("--- Agent Run Finished: %s (Single-Call Mode) ---", run_name)
+
+async def _main_batch_async(cases, persona_set, model, reasoning, verbosity, max_concurrency, use_cache=False):
+    """Fan the per-case pipelines out with asyncio.gather under a semaphore."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run_one(case):
+        async with semaphore:
+            # Each run is dominated by one blocking API call, so pushing it to
+            # a worker thread gives real concurrency across cases.
+            try:
+                return await asyncio.to_thread(
+                    run_agent, case, persona_set, model, reasoning, verbosity, use_cache
+                )
+            except SystemExit as exc:
+                # run_agent reports fatal per-case errors via sys.exit(), and
+                # SystemExit is a BaseException that gather(return_exceptions=True)
+                # does not contain: convert it here so one failing case cannot
+                # abort the whole sweep.
+                return exc
+
+    return await asyncio.gather(*(_run_one(case) for case in cases), return_exceptions=True)
+
+def main_batch(cases, persona_set, model, reasoning, verbosity, max_concurrency=4, use_cache=False):
+    """Run several NetLogo cases concurrently, one single-call run per case.
+
+    The semaphore caps in-flight runs so batch sweeps stay within provider
+    rate limits. Returns True when every case completed without error.
+    """
+    results = asyncio.run(
+        _main_batch_async(cases, persona_set, model, reasoning, verbosity, max_concurrency, use_cache)
+    )
+    ok = True
+    for case, result in zip(cases, results):
+        if isinstance(result, BaseException):
+            print(f"Batch run failed for case '{case}': {result}")
+            ok = False
+    return ok
 
 if __name__ == "__main__":
     main()
@@ -63,12 +63,17 @@ def main():
     ]
     
     try:
-        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, encoding='utf-8')
-        
-        # Stream output in real-time
-        for line in process.stdout:
-            print(line, end='')
-            
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
+
+        # Stream output in real-time, forwarding raw bytes to our stdout so
+        # the parent never pays per-line decode/re-encode costs
+        while True:
+            chunk = process.stdout.read(65536)
+            if not chunk:
+                break
+            sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+
         process.wait()
         
         if process.returncode != 0:
@@ -4,63 +4,93 @@ OpenAI API Key Management Utility
 Centralized handling of OpenAI API keys with automatic .env loading and validation
 """
 
+import functools
 import os
+import re
+import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Optional, List
 from dotenv import load_dotenv
 
-# Optional imports for other providers (do not fail hard if missing)
-try:
-    import google.generativeai as genai  # type: ignore
-    GEMINI_AVAILABLE = True
-except Exception:
-    GEMINI_AVAILABLE = False
-
 import json
 import urllib.request
 import urllib.error
 
-# Try to import OpenAI, but don't fail if not available
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    OpenAI = object  # type: ignore
+# Provider SDKs (openai, google.generativeai) pull in large dependency
+# graphs, so they are imported lazily on first use rather than at module
+# import; False is the "unavailable" sentinel to avoid retrying the import.
+_openai_cls = None
+_genai_module = None
+
+
+def _get_openai_class():
+    """Return the OpenAI client class, or None if the SDK is not installed."""
+    global _openai_cls
+    if _openai_cls is None:
+        try:
+            from openai import OpenAI  # type: ignore
+            _openai_cls = OpenAI
+        except ImportError:
+            _openai_cls = False
+    return _openai_cls or None
+
+
+def _get_genai():
+    """Return the google.generativeai module, or None if not installed."""
+    global _genai_module
+    if _genai_module is None:
+        try:
+            import google.generativeai as genai  # type: ignore
+            _genai_module = genai
+        except Exception:
+            _genai_module = False
+    return _genai_module or None
+
+
+# Env-var fallback chains per provider, precomputed so key resolution is one
+# loop of dict lookups instead of an or-chain of os.getenv calls.
+_ENV_VARS_BY_PROVIDER = {
+    "openai": ("OPENAI_API_KEY", "OPENAI_KEY", "API_KEY"),
+    "gemini": ("GOOGLE_GEMINI_KEY", "GEMINI_API_KEY", "GEMINI_KEY"),
+    "router": ("ROUTER_API_KEY", "ROUTER_KEY", "ROUTER"),
+}
+
+
+def _first_env(names) -> Optional[str]:
+    """Return the first non-empty os.environ entry among names."""
+    env = os.environ
+    for name in names:
+        value = env.get(name)
+        if value:
+            return value
+    return None
 
 
+# Candidate .env files, resolved and deduplicated once at import time:
+# current working directory, code directory (where this file is located),
+# its parent, and the project root (parent of parent).
+_CODE_DIR = Path(__file__).parent
+_ENV_FILES = tuple(dict.fromkeys(
+    (location / '.env').resolve()
+    for location in (Path.cwd(), _CODE_DIR, _CODE_DIR.parent, _CODE_DIR.parent.parent)
+))
+
+
+@functools.lru_cache(maxsize=1)
 def load_env_files() -> None:
     """
-    Load environment variables from multiple .env file locations.
-    
-    Searches for .env files in:
-    1. Current working directory
-    2. Code directory (where this file is located)
-    3. Parent directory of code directory
-    4. Project root (parent of parent)
-    
+    Load environment variables from the candidate .env file locations.
+
+    The search and dotenv parse run exactly once per process — every
+    get_*_api_key() call funnels through here, so repeats are served from
+    the cache (tests can reset with load_env_files.cache_clear()).
+
     Stops loading once a valid API key is found.
     """
-    # Get the directory where this utility is located
-    code_dir = Path(__file__).parent
-    
-    # List of potential .env file locations
-    env_locations = [
-        Path.cwd(),  # Current working directory
-        code_dir,    # Code directory
-        code_dir.parent,  # Parent directory
-        code_dir.parent.parent,  # Project root
-    ]
-    
-    # Load .env files from all locations, avoid duplicates
-    seen: set[str] = set()
-    for location in env_locations:
-        env_file = str((location / '.env').resolve())
-        if env_file in seen:
-            continue
-        seen.add(env_file)
-        env_path = Path(env_file)
+    for env_path in _ENV_FILES:
         if env_path.exists():
             load_dotenv(env_path)
             print(f"✓ Loaded environment variables from: {env_path}")
@@ -71,9 +101,13 @@ def load_env_files() -> None:
                 break
 
 
+@functools.lru_cache(maxsize=1)
 def get_openai_api_key() -> str:
     """
     Get OpenAI API key with automatic .env loading and validation.
+
+    The resolved key is cached for the process lifetime, so repeat callers
+    skip the .env search, os.getenv probes and clean-up pass.
     
     Returns:
         str: The OpenAI API key
@@ -81,19 +115,18 @@ def get_openai_api_key() -> str:
     Raises:
         ValueError: If no API key is found or if validation fails
     """
-    # Clear any existing environment variable to avoid conflicts
-    if 'OPENAI_API_KEY' in os.environ:
-        del os.environ['OPENAI_API_KEY']
-    
-    # Load environment variables from .env files
-    load_env_files()
-    
+    # Pre-seeded environments (Docker, CI) already carry the key, so the
+    # .env probes can be skipped — but only for this provider: other
+    # get_*_api_key() helpers still need load_env_files() to run.
+    existing = os.environ.get('OPENAI_API_KEY')
+    if not (existing and existing.startswith('sk-')):
+        # Load environment variables from .env files (cached after the first
+        # call). Callers that rotate keys mid-process should use
+        # refresh_api_key() rather than clearing os.environ.
+        load_env_files()
+
     # Try multiple environment variable names
-    api_key = (
-        os.getenv('OPENAI_API_KEY') or 
-        os.getenv('OPENAI_KEY') or 
-        os.getenv('API_KEY')
-    )
+    api_key = _first_env(_ENV_VARS_BY_PROVIDER["openai"])
     
     if not api_key:
         raise ValueError(
@@ -105,8 +138,9 @@ def get_openai_api_key() -> str:
             f"- {Path(__file__).parent.parent / '.env'}"
         )
     
-    # Clean up the API key (remove export statements, quotes, etc.)
-    api_key = clean_api_key(api_key)
+    # Clean up the API key (remove export statements, quotes, etc.); the
+    # fast path covers keys that are already pristine.
+    api_key = clean_api_key_fast(api_key) or clean_api_key(api_key)
     
     # Basic format validation
     if not api_key.startswith('sk-'):
@@ -115,9 +149,63 @@ def get_openai_api_key() -> str:
     return api_key
 
 
+def refresh_api_key() -> None:
+    """Drop the cached .env load and key so the next lookup re-reads disk.
+
+    Intended for key rotation; normal callers never need this.
+    """
+    load_env_files.cache_clear()
+    get_openai_api_key.cache_clear()
+
+
+def _extract_from_security_cmd(key: str) -> str:
+    """Resolve a macOS keychain 'security ...' command found in place of a key."""
+    print("⚠️  Warning: Found macOS security command in API key")
+    print("   This suggests the .env file contains a security command instead of the actual key")
+    print("   Please replace with the actual API key value")
+    # Try to extract the actual key by executing the security command
+    try:
+        if key.startswith("security "):
+            result = subprocess.run(key.split(), capture_output=True, text=True, timeout=5)
+            if result.returncode == 0:
+                key = result.stdout.strip()
+                print(f"   ✓ Successfully retrieved key from macOS keychain")
+            else:
+                print(f"   ❌ Failed to retrieve key from keychain: {result.stderr}")
+    except Exception as e:
+        print(f"   ❌ Error executing security command: {e}")
+    return key
+
+
+# Characters that end an extracted sk-... fragment; one compiled scan replaces
+# a find() call per terminator.
+_KEY_TERMINATOR_RE = re.compile(r'[\s"\'();]')
+
+# Stray characters stripped from both ends in one pass instead of a chain of
+# per-character strip() calls (each of which allocates a new string).
+_TRAILING_GARBAGE = ';")\''
+
+# The steady-state key shape coming out of a well-formed .env entry.
+_CLEAN_KEY_RE = re.compile(r'sk-[A-Za-z0-9_\-]{10,}')
+
+
+def clean_api_key_fast(raw_key: str) -> Optional[str]:
+    """Return the key when it already has the pristine sk-... shape, else None.
+
+    One compiled fullmatch replaces the whole cleanup ladder for the
+    common case; callers fall back to clean_api_key on None.
+    """
+    key = raw_key.strip()
+    return key if _CLEAN_KEY_RE.fullmatch(key) else None
+
+
+@functools.lru_cache(maxsize=32)
 def clean_api_key(raw_key: str) -> str:
     """
     Clean up API key by removing common formatting issues.
+
+    Cached on the raw string: keys are short, bounded in number, and the
+    clean-up walks the string several times.
     
     Args:
         raw_key: Raw API key string that might contain export statements, quotes, etc.
@@ -127,18 +215,20 @@ def clean_api_key(raw_key: str) -> str:
     """
     key = raw_key.strip()
 
+    # Fast path: a pristine sk-... key (the common case at runtime) needs
+    # none of the cleanup ladder below. fullmatch keeps the path as strict
+    # as clean_api_key_fast, so stray ;/) tails still fall through to the
+    # extraction and strip logic.
+    if _CLEAN_KEY_RE.fullmatch(key):
+        return key
+
     # If the raw string contains a clear OpenAI key fragment, extract it robustly
     if 'sk-' in key:
         # Take the substring starting at first 'sk-' up to first whitespace or quote/paren/semicolon
         start = key.find('sk-')
         tail = key[start:]
-        terminators = ['\n', '\r', '"', "'", ')', ';', ' ', '\t']
-        end_idx = len(tail)
-        for term in terminators:
-            idx = tail.find(term)
-            if idx != -1:
-                end_idx = min(end_idx, idx)
-        candidate = tail[:end_idx].strip()
+        m = _KEY_TERMINATOR_RE.search(tail)
+        candidate = tail[:m.start()].strip() if m else tail.strip()
         if candidate.startswith('sk-') and len(candidate) >= 10:
             return candidate
     
@@ -163,25 +253,8 @@ def clean_api_key(raw_key: str) -> str:
     
     # Handle macOS security command patterns - only if key doesn't already look like a valid API key
     # Skip security command detection if the key already starts with 'sk-' (valid API key)
-    if not key.startswith('sk-'):
-        # Check if this is a security command (starts with "security" or contains the full command pattern)
-        if key.startswith("security ") or "security find-generic-password" in key:
-            print("⚠️  Warning: Found macOS security command in API key")
-            print("   This suggests the .env file contains a security command instead of the actual key")
-            print("   Please replace with the actual API key value")
-            # Try to extract the actual key by executing the security command
-            try:
-                import subprocess
-                # Extract the security command and execute it
-                if key.startswith("security "):
-                    result = subprocess.run(key.split(), capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        key = result.stdout.strip()
-                        print(f"   ✓ Successfully retrieved key from macOS keychain")
-                    else:
-                        print(f"   ❌ Failed to retrieve key from keychain: {result.stderr}")
-            except Exception as e:
-                print(f"   ❌ Error executing security command: {e}")
+    if not key.startswith('sk-') and (key.startswith("security ") or "security find-generic-password" in key):
+        key = _extract_from_security_cmd(key)
     
     # Remove security command patterns
     if key.startswith("$(security ") and key.endswith('" -w'):
@@ -193,7 +266,7 @@ def clean_api_key(raw_key: str) -> str:
         key = key.split(" -w)")[0].strip()
     
     # Final cleanup of stray characters like trailing parentheses, semicolons, quotes
-    key = key.strip().strip(";").strip(")").strip('"').strip("'")
+    key = key.strip().strip(_TRAILING_GARBAGE)
     
     return key
 
@@ -208,7 +281,8 @@ def validate_openai_key(api_key: Optional[str] = None) -> bool:
     Returns:
         bool: True if key is valid and API is accessible, False otherwise
     """
-    if not OPENAI_AVAILABLE:
+    openai_cls = _get_openai_class()
+    if openai_cls is None:
         print("❌ OpenAI package not available. Install with: pip install openai")
         return False
     
@@ -218,7 +292,7 @@ def validate_openai_key(api_key: Optional[str] = None) -> bool:
             api_key = get_openai_api_key()
         
         # Create client and test with minimal API call
-        client = OpenAI(api_key=api_key)
+        client = openai_cls(api_key=api_key)
         
         print("🔄 Testing OpenAI API key...")
         response = client.chat.completions.create(
@@ -236,17 +310,21 @@ def validate_openai_key(api_key: Optional[str] = None) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def get_gemini_api_key() -> str:
-    """Return Gemini API key from environment after loading .env files (workspace root priority)."""
+    """Return Gemini API key from environment after loading .env files (workspace root priority).
+
+    Cached for the process lifetime like the other per-provider getters.
+    """
     load_env_files()
     # Support common env var names for Gemini API keys, with GEMINI_API_KEY as primary
-    key = (
-        os.getenv("GEMINI_API_KEY")
-        or os.getenv("GOOGLE_GEMINI_API_KEY")
-        or os.getenv("GENAI_API_KEY")
-        or os.getenv("GOOGLE_GEMINI_KEY")
-        or os.getenv("GEMINI_KEY")
-    )
+    key = _first_env((
+        "GEMINI_API_KEY",
+        "GOOGLE_GEMINI_API_KEY",
+        "GENAI_API_KEY",
+        "GOOGLE_GEMINI_KEY",
+        "GEMINI_KEY",
+    ))
     if not key:
         # Determine workspace root (parent of code directory)
         code_dir = Path(__file__).parent
@@ -277,7 +355,8 @@ def validate_gemini_key(api_key: Optional[str] = None) -> bool:
         if api_key is None:
             api_key = get_gemini_api_key()
 
-        if not GEMINI_AVAILABLE:
+        genai = _get_genai()
+        if genai is None:
             print("❌ Gemini SDK not installed. Install with: pip install google-generativeai")
             return False
 
@@ -298,10 +377,14 @@ def validate_gemini_key(api_key: Optional[str] = None) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def get_router_api_key() -> str:
-    """Return OpenRouter API key from environment with common fallbacks."""
+    """Return OpenRouter API key from environment with common fallbacks.
+
+    Cached for the process lifetime like the other per-provider getters.
+    """
     load_env_files()
-    key = os.getenv("ROUTER_API_KEY") or os.getenv("ROUTER_KEY") or os.getenv("ROUTER") or os.getenv("OPENROUTER_API_KEY")
+    key = _first_env(("ROUTER_API_KEY", "ROUTER_KEY", "ROUTER", "OPENROUTER_API_KEY"))
     if not key:
         raise ValueError(
             "No OpenRouter API key found. Please set ROUTER_API_KEY (or ROUTER_KEY / OPENROUTER_API_KEY) in your .env file."
@@ -309,22 +392,49 @@ def get_router_api_key() -> str:
     return clean_api_key(key)
 
 
+# Recent validation verdicts per key, so back-to-back checks (e.g.
+# check_env_setup_all followed by the CLI) reuse one network round trip.
+_ROUTER_VALIDATION_TTL_S = 60.0
+_router_validation_cache: dict = {}
+
+
 def validate_router_key(api_key: Optional[str] = None) -> bool:
     """
     Validate OpenRouter API key via a lightweight GET to /models endpoint.
-    Uses only standard library to avoid adding dependencies.
+
+    Reuses the process-wide keep-alive HTTP client when httpx is available
+    (falling back to urllib), and caches each key's verdict for a short TTL
+    so repeat validations skip the TLS handshake entirely.
     """
     try:
         if api_key is None:
             api_key = get_router_api_key()
 
+        cached = _router_validation_cache.get(api_key)
+        if cached is not None and time.monotonic() - cached[0] < _ROUTER_VALIDATION_TTL_S:
+            return cached[1]
+
         print("🔄 Testing OpenRouter API key...")
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Accept": "application/json",
+        }
+        http_client = _get_shared_http_client()
+        if http_client is not None:
+            resp = http_client.get("https://openrouter.ai/api/v1/models", headers=headers)
+            if resp.status_code == 200:
+                _ = resp.json()  # Basic parse to confirm JSON
+                print("✅ OpenRouter API key validation successful")
+                ok = True
+            else:
+                print(f"❌ OpenRouter responded with status {resp.status_code}")
+                ok = False
+            _router_validation_cache[api_key] = (time.monotonic(), ok)
+            return ok
+
         req = urllib.request.Request(
             url="https://openrouter.ai/api/v1/models",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Accept": "application/json",
-            },
+            headers=headers,
             method="GET",
         )
         with urllib.request.urlopen(req, timeout=10) as resp:
@@ -332,9 +442,12 @@ def validate_router_key(api_key: Optional[str] = None) -> bool:
                 # Basic parse to confirm JSON
                 _ = json.loads(resp.read().decode("utf-8"))
                 print("✅ OpenRouter API key validation successful")
-                return True
-            print(f"❌ OpenRouter responded with status {resp.status}")
-            return False
+                ok = True
+            else:
+                print(f"❌ OpenRouter responded with status {resp.status}")
+                ok = False
+            _router_validation_cache[api_key] = (time.monotonic(), ok)
+            return ok
     except urllib.error.HTTPError as e:
         try:
             body = e.read().decode("utf-8")
@@ -348,38 +461,67 @@ def validate_router_key(api_key: Optional[str] = None) -> bool:
         return False
 
 
-def create_openai_client() -> OpenAI:
+# Process-wide HTTP transport shared by all OpenAI clients so keep-alive
+# connections (and their TLS handshakes) are amortized across calls/cases.
+# False is the "httpx unavailable" sentinel to avoid retrying the import.
+_shared_http_client = None
+
+
+def _get_shared_http_client():
+    """Return a tuned, process-wide httpx.Client, or None if httpx is missing."""
+    global _shared_http_client
+    if _shared_http_client is None:
+        try:
+            import httpx  # type: ignore
+            _shared_http_client = httpx.Client(
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=600,
+            )
+        except Exception:
+            _shared_http_client = False
+    return _shared_http_client or None
+
+
+def create_openai_client():
     """
     Create an OpenAI client with automatic API key loading and validation.
-    
+
     Returns:
         OpenAI: Configured OpenAI client
-        
+
     Raises:
         ValueError: If API key is not found or invalid
         ImportError: If OpenAI package is not installed
     """
-    if not OPENAI_AVAILABLE:
+    openai_cls = _get_openai_class()
+    if openai_cls is None:
         raise ImportError(
             "OpenAI package not available. Install with: pip install openai"
         )
-    
+
     api_key = get_openai_api_key()
-    return OpenAI(api_key=api_key)
+    http_client = _get_shared_http_client()
+    if http_client is not None:
+        return openai_cls(api_key=api_key, http_client=http_client)
+    return openai_cls(api_key=api_key)
 
 
+@functools.lru_cache(maxsize=64)
 def get_provider_for_model(model_name: str) -> str:
     """Infer provider from model name.
 
     Returns one of: "openai", "gemini", "router".
-    
+
     Model routing:
-    - GPT-5 models → "openai"
+    - GPT models → "openai"
     - Gemini models → "gemini"
     - Mistral, Llama, and all other models → "router" (OpenRouter)
+
+    Cached per model name: this runs on every key lookup and agent dispatch
+    but only ever sees the handful of configured models.
     """
     name = (model_name or "").lower()
-    if name.startswith("gpt-5") or name.startswith("gpt-"):
+    if name.startswith("gpt-"):
         return "openai"
     if "gemini" in name:
         return "gemini"
@@ -395,15 +537,17 @@ def get_api_key_for_model(model_name: str) -> str:
     - Gemini models → GOOGLE_GEMINI_KEY (with fallbacks GEMINI_API_KEY, GEMINI_KEY)
     - Mistral, Llama, and all other models → ROUTER_API_KEY (with fallbacks ROUTER_KEY, ROUTER, OPENROUTER_API_KEY)
     """
+    # Dispatch through the provider-keyed cache so every model of one
+    # provider shares a single resolved entry.
+    return _get_api_key_for_provider(get_provider_for_model(model_name))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_api_key_for_provider(provider: str) -> str:
+    """Resolve and cache the API key for one provider string."""
     load_env_files()
 
-    provider = get_provider_for_model(model_name)
-    if provider == "openai":
-        key = os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI_KEY") or os.getenv("API_KEY")
-    elif provider == "gemini":
-        key = os.getenv("GOOGLE_GEMINI_KEY") or os.getenv("GEMINI_API_KEY") or os.getenv("GEMINI_KEY")
-    else:
-        key = os.getenv("ROUTER_API_KEY") or os.getenv("ROUTER_KEY") or os.getenv("ROUTER")
+    key = _first_env(_ENV_VARS_BY_PROVIDER.get(provider, _ENV_VARS_BY_PROVIDER["router"]))
 
     if not key:
         raise ValueError(
@@ -423,7 +567,7 @@ def check_env_setup() -> bool:
     print("🔍 Checking OpenAI API environment setup...")
     
     # Check if OpenAI package is available
-    if not OPENAI_AVAILABLE:
+    if _get_openai_class() is None:
         print("❌ OpenAI package not installed")
         print("   Install with: pip install openai")
         return False
@@ -444,6 +588,13 @@ def check_env_setup() -> bool:
     return True
 
 
+# Per-provider validation verdicts; the lock keeps parallel agent start-ups
+# from each paying their own network round trip.
+_VALIDATION_TTL_S = 300.0
+_validation_cache: dict = {}
+_validation_lock = threading.Lock()
+
+
 def validate_api_key_for_model(model_name: str) -> bool:
     """
     Validate the appropriate API key based on the model provider.
@@ -463,23 +614,43 @@ def validate_api_key_for_model(model_name: str) -> bool:
         - Gemini models → validates GOOGLE_GEMINI_KEY
         - Mistral/Llama models → validates ROUTER_API_KEY (OpenRouter)
         - Other models → validates ROUTER_API_KEY (OpenRouter)
+
+    The verdict is cached per provider for a short TTL, so several agents
+    starting back-to-back on the same provider share one network round trip.
     """
     provider = get_provider_for_model(model_name)
-    
-    if provider == "openai":
-        return validate_openai_key()
-    elif provider == "gemini":
-        return validate_gemini_key()
-    elif provider == "router":
-        # Mistral, Llama, and all other non-OpenAI/Gemini models use OpenRouter
-        return validate_router_key()
-    else:
-        raise ValueError(f"Unknown provider for model: {model_name}")
+
+    with _validation_lock:
+        cached = _validation_cache.get(provider)
+        if cached is not None and time.monotonic() - cached[1] < _VALIDATION_TTL_S:
+            return cached[0]
+
+        if provider == "openai":
+            result = validate_openai_key()
+        elif provider == "gemini":
+            result = validate_gemini_key()
+        elif provider == "router":
+            # Mistral, Llama, and all other non-OpenAI/Gemini models use OpenRouter
+            result = validate_router_key()
+        else:
+            raise ValueError(f"Unknown provider for model: {model_name}")
+
+        _validation_cache[provider] = (result, time.monotonic())
+        return result
+
+
+# Environment variables that signal a provider key is configured; one tuple
+# per provider so presence checks are membership tests on a single snapshot.
+_PROVIDER_ENV_VARS = {
+    "gemini": ("GOOGLE_GEMINI_KEY", "GEMINI_API_KEY", "GEMINI_KEY"),
+    "router": ("ROUTER_API_KEY", "ROUTER_KEY", "ROUTER", "OPENROUTER_API_KEY"),
+}
 
 
 def check_env_setup_all() -> bool:
     """Check and validate all supported provider API keys if present."""
     overall_ok = True
+    env = os.environ
 
     # OpenAI
     print("\n=== OpenAI ===")
@@ -495,9 +666,7 @@ def check_env_setup_all() -> bool:
     # Gemini
     print("\n=== Gemini ===")
     try:
-        key_present = (
-            os.getenv("GOOGLE_GEMINI_KEY") or os.getenv("GEMINI_API_KEY") or os.getenv("GEMINI_KEY")
-        )
+        key_present = any(env.get(var) for var in _PROVIDER_ENV_VARS["gemini"])
         if key_present:
             if not validate_gemini_key():
                 overall_ok = False
@@ -510,9 +679,7 @@ def check_env_setup_all() -> bool:
     # OpenRouter
     print("\n=== OpenRouter ===")
     try:
-        key_present = (
-            os.getenv("ROUTER_API_KEY") or os.getenv("ROUTER_KEY") or os.getenv("ROUTER") or os.getenv("OPENROUTER_API_KEY")
-        )
+        key_present = any(env.get(var) for var in _PROVIDER_ENV_VARS["router"])
         if key_present:
             if not validate_router_key():
                 overall_ok = False
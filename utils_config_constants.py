@@ -4,7 +4,9 @@ Configuration file for NetLogo to PlantUML pipeline
 Centralizes all file and directory path constants
 """
 
+import functools
 import os
+import types
 from utils_api_key import get_api_key_for_model
 import pathlib
 from pathlib import Path
@@ -66,8 +68,17 @@ AVAILABLE_MODELS = [
 # Default model derived from AVAILABLE_MODELS
 DEFAULT_MODEL = AVAILABLE_MODELS[1] if AVAILABLE_MODELS else ""
 
-# API key selected dynamically based on the default model/provider
-OPENAI_API_KEY = get_api_key_for_model(DEFAULT_MODEL) if DEFAULT_MODEL else ""
+# API key selected dynamically based on the default model/provider. Resolved
+# lazily so importing this module never pays (or fails on) env resolution;
+# get_api_key_for_model caches per provider, so repeats are free.
+def get_default_api_key() -> str:
+    """Return the API key for DEFAULT_MODEL, or "" when unavailable."""
+    if not DEFAULT_MODEL:
+        return ""
+    try:
+        return get_api_key_for_model(DEFAULT_MODEL)
+    except ValueError:
+        return ""
 
 # Agent-specific configurations
 # Each agent can be configured with:
@@ -75,43 +86,27 @@ OPENAI_API_KEY = get_api_key_for_model(DEFAULT_MODEL) if DEFAULT_MODEL else ""
 # - reasoning_effort: "minimal", "low", "medium", or "high"
 # - reasoning_summary: "auto" or "manual"
 # - text_verbosity: "low", "medium", or "high"
+# Every agent currently uses the same defaults; one immutable mapping shared
+# across all six entries keeps them in sync and guards against accidental
+# mutation through get_agent_config. Give an agent its own (proxy-wrapped)
+# dict here if it ever needs to diverge.
+_BASE_AGENT_CONFIG = types.MappingProxyType({
+    "model": DEFAULT_MODEL,
+    "reasoning_effort": "medium",
+    "reasoning_summary": "auto",
+    "text_verbosity": "medium",
+})
+
 AGENT_CONFIGS = {
-    "lucim_operation_model_generator": {
-        "model": DEFAULT_MODEL,
-        "reasoning_effort": "medium",
-        "reasoning_summary": "auto",
-        "text_verbosity": "medium"
-    },
-    "lucim_operation_model_auditor": {
-        "model": DEFAULT_MODEL,
-        "reasoning_effort": "medium",
-        "reasoning_summary": "auto",
-        "text_verbosity": "medium"
-    },
-    "lucim_scenario_generator": {
-        "model": DEFAULT_MODEL,
-        "reasoning_effort": "medium",
-        "reasoning_summary": "auto",
-        "text_verbosity": "medium"
-    },
-    "lucim_scenario_auditor": {
-        "model": DEFAULT_MODEL,
-        "reasoning_effort": "medium",
-        "reasoning_summary": "auto",
-        "text_verbosity": "medium"
-    },
-    "lucim_plantuml_diagram_generator": {
-        "model": DEFAULT_MODEL,
-        "reasoning_effort": "medium",
-        "reasoning_summary": "auto",
-        "text_verbosity": "medium"
-    },
-    "lucim_plantuml_diagram_auditor": {
-        "model": DEFAULT_MODEL,
-        "reasoning_effort": "medium",  # Default medium for consistency
-        "reasoning_summary": "auto",
-        "text_verbosity": "medium"
-    }
+    name: _BASE_AGENT_CONFIG
+    for name in (
+        "lucim_operation_model_generator",
+        "lucim_operation_model_auditor",
+        "lucim_scenario_generator",
+        "lucim_scenario_auditor",
+        "lucim_plantuml_diagram_generator",
+        "lucim_plantuml_diagram_auditor",
+    )
 }
 
 # Timeouts and heartbeat (in seconds)
@@ -144,12 +139,21 @@ def ensure_directories():
     # INPUT_VALID_EXAMPLES_DIR is a symlink, don't try to create it
 
 
+@functools.lru_cache(maxsize=16)
 def get_agent_config(agent_name: str) -> dict:
-    """Get the complete configuration for a specific agent"""
+    """Get the complete configuration for a specific agent.
+
+    Memoized: the configs are static for the process lifetime, so callers
+    share one dict per agent and should treat it as read-only.
+    """
     return AGENT_CONFIGS.get(agent_name, AGENT_CONFIGS.get("lucim_operation_model_generator", {}))
 
+@functools.lru_cache(maxsize=16)
 def get_reasoning_config(agent_name: str) -> dict:
-    """Get the complete API configuration for an agent including reasoning, text and model"""
+    """Get the complete API configuration for an agent including reasoning, text and model.
+
+    Memoized like get_agent_config; treat the returned dict as read-only.
+    """
     agent_config = get_agent_config(agent_name)
     model_name = agent_config["model"]
 
@@ -188,6 +192,12 @@ AGENT_RESPONSE_SCHEMA = {
     }
 }
 
+# Schema items materialized once so the hot validation loop iterates a tuple
+# instead of re-walking the nested dict view on every response.
+_SCHEMA_ITEMS = tuple(AGENT_RESPONSE_SCHEMA["common_fields"].items())
+_MISSING = object()
+
+
 def validate_agent_response(agent_type: str, response: dict) -> list:
     """Validate that response contains required common fields with correct types.
 
@@ -197,11 +207,13 @@ def validate_agent_response(agent_type: str, response: dict) -> list:
     """
     errors = []
 
-    for field, field_type in AGENT_RESPONSE_SCHEMA["common_fields"].items():
-        if field not in response:
+    for field, field_type in _SCHEMA_ITEMS:
+        # Sentinel get avoids the membership probe plus second lookup
+        value = response.get(field, _MISSING)
+        if value is _MISSING:
             errors.append(f"Missing required field: {field}")
         # If schema permits multiple types, isinstance handles tuple typing
-        elif not isinstance(response[field], field_type):
+        elif not isinstance(value, field_type):
             errors.append(f"Field {field} must be of type {field_type}")
 
     return errors
@@ -231,30 +243,36 @@ COMMON_KEYS = {
 # Some agents might include raw_response dump for auditing
 OPTIONAL_KEYS = {"raw_response"}
 
+# Frozen default computed once; every agent currently shares it, and freezing
+# guards against accidental mutation of the shared set by callers.
+_DEFAULT_KEYS = frozenset(COMMON_KEYS | OPTIONAL_KEYS)
+
 AGENT_KEYS: Dict[str, Set[str]] = {
-    "lucim_operation_model_generator": COMMON_KEYS | OPTIONAL_KEYS,
-    "lucim_operation_model_auditor": COMMON_KEYS | OPTIONAL_KEYS,
-    "lucim_scenario_generator": COMMON_KEYS | OPTIONAL_KEYS,
-    "lucim_scenario_auditor": COMMON_KEYS | OPTIONAL_KEYS,
-    "lucim_plantuml_diagram_generator": COMMON_KEYS | OPTIONAL_KEYS,
-    "lucim_plantuml_diagram_auditor": COMMON_KEYS | OPTIONAL_KEYS,
+    "lucim_operation_model_generator": _DEFAULT_KEYS,
+    "lucim_operation_model_auditor": _DEFAULT_KEYS,
+    "lucim_scenario_generator": _DEFAULT_KEYS,
+    "lucim_scenario_auditor": _DEFAULT_KEYS,
+    "lucim_plantuml_diagram_generator": _DEFAULT_KEYS,
+    "lucim_plantuml_diagram_auditor": _DEFAULT_KEYS,
 }
 
 
 def expected_keys_for_agent(agent_type: str) -> Set[str]:
     """Get expected keys for a specific agent type."""
-    return AGENT_KEYS.get(agent_type, COMMON_KEYS | OPTIONAL_KEYS)
+    return AGENT_KEYS.get(agent_type, _DEFAULT_KEYS)
 
 
+@functools.lru_cache(maxsize=8)
 def get_persona_file_paths(persona_set: str = DEFAULT_PERSONA_SET) -> Dict[str, Path]:
     """
     Get persona file paths for a specific persona set.
-    
+
     Args:
         persona_set: Name of the persona set (subfolder in input-persona)
-        
+
     Returns:
-        Dictionary mapping persona file names to their paths
+        Dictionary mapping persona file names to their paths.
+        Memoized per persona set; callers should treat the dict as read-only.
     """
     persona_dir = INPUT_PERSONA_DIR / persona_set
     
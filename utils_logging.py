@@ -4,6 +4,7 @@ Logging utilities for NetLogo to PlantUML pipeline
 Provides centralized logging configuration and file management
 """
 
+import atexit
 import logging
 import sys
 import io
@@ -13,6 +14,31 @@ from typing import Optional
 from utils_config_constants import OUTPUT_DIR
 from utils_path import get_run_base_dir
 
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler without the per-record flush.
+
+    The stock handler flushes after every record, costing one write syscall
+    per log line. Here INFO records accumulate in the stream buffer and reach
+    the terminal in larger writes; warnings and errors still flush
+    immediately so failures stay visible in real time, and an atexit hook
+    drains the tail.
+    """
+
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        atexit.register(self.flush)
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
 def _stringify(obj) -> str:
     """Safely stringify arbitrary objects for Markdown output."""
     try:
@@ -174,7 +200,7 @@ def setup_run_logger(base_name: str, model_name: str, timestamp: str, reasoning_
     file_handler.setFormatter(formatter)
     
     # Create console handler bound to original stdout to avoid recursion when stdout/stderr are redirected
-    console_handler = logging.StreamHandler(stream=sys.__stdout__)
+    console_handler = BufferedStreamHandler(stream=sys.__stdout__)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
     
@@ -244,7 +270,7 @@ def get_agent_logger(agent_name: str, base_name: str, model_name: str, timestamp
     file_handler.setFormatter(formatter)
     
     # Create console handler bound to original stdout to avoid recursion when stdout/stderr are redirected
-    console_handler = logging.StreamHandler(stream=sys.__stdout__)
+    console_handler = BufferedStreamHandler(stream=sys.__stdout__)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
     
@@ -45,11 +45,12 @@ def validate_openai_key() -> bool:
     Raises:
         SystemExit: If OPENAI_API_KEY environment variable is not set
     """
-    # Import centralized key from config
-    from utils_config_constants import OPENAI_API_KEY
-    
+    # Resolve the centralized key lazily via config
+    from utils_config_constants import get_default_api_key
+    api_key = get_default_api_key()
+
     # Check if API key is set
-    if not OPENAI_API_KEY:
+    if not api_key:
         print("ERROR: OPENAI_API_KEY environment variable is not set")
         print("Please set your OpenAI API key:")
         print("  export OPENAI_API_KEY='your-api-key-here'")
@@ -57,7 +58,7 @@ def validate_openai_key() -> bool:
     
     # Test the key with a simple API call
     try:
-        client = OpenAI(api_key=OPENAI_API_KEY)
+        client = OpenAI(api_key=api_key)
         
         # Make a minimal test call to validate the key
         # Using a simple completion request that should work with any valid key
@@ -107,6 +108,71 @@ def create_and_wait(
 # Streaming helpers were removed as the project no longer persists streaming artifacts.
 
 
+def submit_batch(
+    client: "OpenAI",
+    requests: Iterable[Dict[str, Any]],
+    completion_window: str = "24h",
+    metadata: Optional[Dict[str, str]] = None,
+) -> Any:
+    """Upload a JSONL of Responses API requests and create a Batch job.
+
+    Each request dict must follow the Batch API line format:
+    {"custom_id": ..., "method": "POST", "url": "/v1/responses", "body": api_config}
+
+    Returns the created batch object. The Batch API trades latency (24h SLA)
+    for 50% cost and much higher throughput — intended for non-interactive
+    bulk runs.
+    """
+    import io
+    import json
+
+    payload = "\n".join(json.dumps(request) for request in requests).encode("utf-8")
+    batch_file = with_retries(lambda: client.files.create(file=io.BytesIO(payload), purpose="batch"))
+    return with_retries(lambda: client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/responses",
+        completion_window=completion_window,
+        metadata=metadata or {},
+    ))
+
+
+def wait_for_batch(
+    client: "OpenAI",
+    batch_id: str,
+    poll_interval_seconds: float = 30.0,
+    max_poll_interval_seconds: float = 300.0,
+    timeout_seconds: Optional[float] = None,
+) -> Any:
+    """Poll a batch job with exponential backoff until it reaches a terminal state.
+
+    Returns the final batch object. Raises RuntimeError on timeout.
+    """
+    start_time = time.time()
+    interval = poll_interval_seconds
+    while True:
+        batch = with_retries(lambda: client.batches.retrieve(batch_id))
+        if getattr(batch, "status", None) in ("completed", "failed", "expired", "cancelled"):
+            return batch
+        if timeout_seconds is not None and (time.time() - start_time) > timeout_seconds:
+            raise RuntimeError(f"Batch {batch_id} polling timed out")
+        time.sleep(interval)
+        interval = min(interval * 2, max_poll_interval_seconds)
+
+
+def iter_batch_results(client: "OpenAI", batch: Any) -> Iterable[Dict[str, Any]]:
+    """Yield parsed result lines ({'custom_id', 'response', ...}) from a completed batch."""
+    import json
+
+    output_file_id = getattr(batch, "output_file_id", None)
+    if not output_file_id:
+        return
+    content = with_retries(lambda: client.files.content(output_file_id))
+    text = content.text if hasattr(content, "text") else content.read().decode("utf-8")
+    for line in text.splitlines():
+        if line.strip():
+            yield json.loads(line)
+
+
 def get_output_text(response: Any) -> str:
     """Return best-effort plain text from a responses object.
 
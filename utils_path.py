@@ -11,12 +11,15 @@ This builder is deterministic and should be the single source of truth
 for output folder computation across modules.
 """
 
+import functools
 import pathlib
-from datetime import datetime
 from typing import Optional
 
 from utils_config_constants import OUTPUT_DIR
 
+# Root of all run outputs, composed once at import time.
+_RUNS_DIR = OUTPUT_DIR / "runs"
+
 
 def build_combination_folder_name(
     base_name: str,
@@ -31,6 +34,7 @@ def build_combination_folder_name(
     return f"{base_name}-{model_name}-reason-{reasoning_effort}-verb-{text_verbosity}"
 
 
+@functools.lru_cache(maxsize=1024)
 def get_run_base_dir(
     timestamp_str: str,
     base_name: str,
@@ -52,18 +56,17 @@ def get_run_base_dir(
 
     Returns:
         Path to: OUTPUT_DIR/runs/YYYY-MM-DD/HHMM-<PERSONA-SET-NAME>/<combination-folder>
+
+    The result is memoized per argument tuple (the same combination is
+    requested once per stage), so repeat calls skip the path composition.
     """
-    dt = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-    run_date = dt.strftime("%Y-%m-%d")
-    run_time = dt.strftime("%H%M")
+    # Timestamps are always "YYYYMMDD_HHMMSS"; slice directly instead of
+    # round-tripping through strptime/strftime.
+    run_date = f"{timestamp_str[:4]}-{timestamp_str[4:6]}-{timestamp_str[6:8]}"
+    run_time = timestamp_str[9:13]
 
     # New fine-grained path: output/runs/<YYYY-MM-DD>/<HHMM>-<PERSONA-SET>/<case>-<model>-reason-<effort>-verb-<verbosity>/
-    run_dir = (
-        OUTPUT_DIR
-        / "runs"
-        / run_date
-        / f"{run_time}-{persona_set}"
-    )
+    run_dir = _RUNS_DIR / run_date / f"{run_time}-{persona_set}"
     combo = build_combination_folder_name(base_name, model_name, reasoning_effort, text_verbosity)
     return run_dir / combo
 
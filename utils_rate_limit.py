@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Rate limiting utilities for provider API calls.
+
+Provides a proactive token-bucket limiter so batch and concurrent runs pace
+themselves under the provider's requests-per-minute and tokens-per-minute
+ceilings instead of bouncing off 429 responses and retry backoff.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Dual token bucket enforcing RPM and TPM budgets.
+
+    Both buckets refill continuously at their per-minute rate. acquire()
+    blocks the calling thread until one request slot and the estimated token
+    budget are available, so callers can simply wrap their API call:
+
+        bucket.acquire(estimated_tokens=len(prompt) // 4)
+        response = ...
+        bucket.record_usage(estimated_tokens, actual_total_tokens)
+
+    The class is thread-safe; the concurrent multi-case mode shares a single
+    instance across worker threads.
+    """
+
+    def __init__(self, rpm: int = 60, tpm: int = 200_000):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._requests = min(float(self.rpm), self._requests + elapsed * self.rpm / 60.0)
+        self._tokens = min(float(self.tpm), self._tokens + elapsed * self.tpm / 60.0)
+
+    def acquire(self, estimated_tokens: int = 0) -> None:
+        """Block until one request slot and estimated_tokens are available."""
+        estimated_tokens = min(estimated_tokens, self.tpm)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._requests >= 1.0 and self._tokens >= estimated_tokens:
+                    self._requests -= 1.0
+                    self._tokens -= estimated_tokens
+                    return
+                # Wait until the scarcer budget has refilled enough
+                request_wait = (1.0 - self._requests) * 60.0 / self.rpm
+                token_wait = (estimated_tokens - self._tokens) * 60.0 / self.tpm
+                wait_seconds = max(request_wait, token_wait, 0.05)
+            time.sleep(wait_seconds)
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Reconcile the token budget with the actual usage reported by the API."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(float(self.tpm), self._tokens + estimated_tokens - actual_tokens)
@@ -4,10 +4,84 @@ Orchestrator Logging Utilities
 Centralized logging and print functions for the NetLogo orchestrator.
 """
 
+import json
 import logging
+import os
+from datetime import datetime
+from operator import itemgetter
 from typing import Dict, Any, List
+from utils_fileio import write_file_content
 from utils_format import FormatUtils
 
+# Optional fast JSON parser (do not fail hard if missing)
+try:
+    import orjson  # type: ignore
+    _loads = orjson.loads
+except Exception:
+    _loads = json.loads
+
+# Static step labels and their results keys, shared by the status loggers
+# (no corrector/final auditor in the v3 pipeline).
+_STEPS = (
+    ("Step 1 - LUCIM Operation Model Generator", "lucim_operation_model_generator"),
+    ("Step 2 - LUCIM Operation Model Auditor", "lucim_operation_model_auditor"),
+    ("Step 3 - LUCIM Scenario Generator", "lucim_scenario_generator"),
+    ("Step 4 - LUCIM Scenario Auditor", "lucim_scenario_auditor"),
+    ("Step 5 - LUCIM PlantUML Diagram Generator", "lucim_plantuml_diagram_generator"),
+    ("Step 6 - LUCIM PlantUML Diagram Auditor", "lucim_plantuml_diagram_auditor"),
+)
+
+# Indexed by bool(success)
+_CHECK = ("✗", "✓")
+_STATUS = ("✗ FAILED", "✓ SUCCESS")
+
+
+def _step_successes(results: Dict[str, Any]) -> Dict[str, bool]:
+    """One pass over results instead of a throwaway {} per step lookup."""
+    return {
+        key: isinstance(value, dict) and value.get("data") is not None
+        for key, value in results.items()
+    }
+
+
+def _step_report(results: Dict[str, Any], line_format: str, marks) -> List[str]:
+    """Render one decorated line per pipeline step.
+
+    Shared by the workflow and detailed status dumps, which differ only in
+    line format and success marks.
+    """
+    successes = _step_successes(results)
+    return [line_format % (label, marks[successes.get(key, False)]) for label, key in _STEPS]
+
+# status -> preformatted compliance report block
+_COMPLIANCE_TEMPLATES = {
+    "VERIFIED": (
+        "\n🔍 COMPLIANCE STATUS:\n"
+        "   ✅ FINAL COMPLIANCE: VERIFIED\n"
+        "   🎯 Result: Final audit confirms LUCIM compliance"
+    ),
+    "NON-COMPLIANT": (
+        "\n🔍 COMPLIANCE STATUS:\n"
+        "   ❌ FINAL COMPLIANCE: NON-COMPLIANT\n"
+        "   📊 Result: One or more LUCIM rules were violated"
+    ),
+}
+_COMPLIANCE_UNKNOWN = (
+    "\n🔍 COMPLIANCE STATUS:\n"
+    "   ❓ COMPLIANCE STATUS: UNKNOWN\n"
+    "   ⚠️  Result: No authoritative compliance verdict available"
+)
+
+# agent_type -> preformatted output-file log line
+_AGENT_OUTPUT_FILES = {
+    "lucim_operation_model_generator": "   • Operation Model: output-data.json",
+    "lucim_operation_model_auditor": "   • Operation Model Audit: output-data.json",
+    "lucim_scenario_generator": "   • Scenarios: output-data.json",
+    "lucim_scenario_auditor": "   • Scenario Audit: output-data.json",
+    "lucim_plantuml_diagram_generator": "   • PlantUML Diagram: diagram.puml + output-data.json",
+    "lucim_plantuml_diagram_auditor": "   • PlantUML Diagram Audit: output-data.json",
+}
+
 
 class OrchestratorLogger:
     """Centralized logging utilities for the orchestrator."""
@@ -21,8 +95,8 @@ class OrchestratorLogger:
         """
         self.logger = logger
 
-    def build_overall_summary(self,
-                              run_name: str,
+    @staticmethod
+    def build_overall_summary(run_name: str,
                               base_name: str,
                               model_name: str,
                               persona_set: str,
@@ -51,7 +125,6 @@ class OrchestratorLogger:
         Returns:
             A markdown formatted summary block.
         """
-        from datetime import datetime
         duration = max(0.0, end_time_seconds - start_time_seconds)
         visible_output = max(tokens.get("output_tokens", 0) - tokens.get("reasoning_tokens", 0), 0)
         lines: List[str] = []
@@ -80,17 +153,19 @@ class OrchestratorLogger:
             lines.append("Artifacts: none detected")
         # Compliance metrics (if both initial and final audits are present among artifacts, or at least one)
         try:
-            import os, json
-            final_path = os.path.join(output_dir, "plantuml_lucim_final_auditor_output.json")
-            initial_path = os.path.join(output_dir, "plantuml_lucim_auditor_output.json")
+            final_name = "plantuml_lucim_final_auditor_output.json"
+            initial_name = "plantuml_lucim_auditor_output.json"
+            # One scandir pass replaces two exists() stats
+            with os.scandir(output_dir) as entries:
+                names = {entry.name for entry in entries}
             initial_data = None
             final_data = None
-            if os.path.exists(initial_path):
-                with open(initial_path, "r", encoding="utf-8") as f:
-                    initial_data = json.load(f)
-            if os.path.exists(final_path):
-                with open(final_path, "r", encoding="utf-8") as f:
-                    final_data = json.load(f)
+            if initial_name in names:
+                with open(os.path.join(output_dir, initial_name), "rb") as f:
+                    initial_data = _loads(f.read())
+            if final_name in names:
+                with open(os.path.join(output_dir, final_name), "rb") as f:
+                    final_data = _loads(f.read())
 
             if final_data and initial_data:
                 from utils_metrics import compute_audit_confusion_metrics  # shared pattern across projects
@@ -125,15 +200,13 @@ class OrchestratorLogger:
 
     def persist_overall_summary(self, output_dir: str, summary_text: str) -> None:
         """Persist the overall summary to overall_summary.md in output_dir."""
-        import os
-        from utils_fileio import write_file_content
         filepath = os.path.join(output_dir, "overall_summary.md")
         write_file_content(filepath, summary_text)
-        self.logger.info(f"Wrote OVERALL SUMMARY file: {filepath}")
+        self.logger.info("Wrote OVERALL SUMMARY file: %s", filepath)
     
     def log_agent_start(self, agent_name: str) -> None:
         """Log the start of an agent execution."""
-        self.logger.info(f"🚀 Starting {agent_name} agent execution...")
+        self.logger.info("🚀 Starting %s agent execution...", agent_name)
     
     def log_agent_completion(self, agent_name: str, duration: float, 
                            tokens_used: int = 0, input_tokens: int = 0, 
@@ -149,22 +222,28 @@ class OrchestratorLogger:
             output_tokens: Output tokens
             reasoning_tokens: Reasoning tokens
         """
-        self.logger.info(f"✅ {agent_name} completed in {FormatUtils.format_duration(duration)}")
-        
+        info = self.logger.info  # bound once; the method logs up to four records
+        info("✅ %s completed in %s", agent_name, FormatUtils.format_duration(duration))
+
         if tokens_used > 0:
             # Calculate visible output tokens
             visible_output_tokens = max(output_tokens - reasoning_tokens, 0)
             total_output_tokens = visible_output_tokens + reasoning_tokens
-            
-            self.logger.info(f"   Input Tokens = {input_tokens:,}")
-            self.logger.info(f"   Output Tokens = {total_output_tokens:,} (reasoning = {reasoning_tokens:,}, visibleOutput={visible_output_tokens:,})")
-            self.logger.info(f"   Total Tokens = {tokens_used:,}")
+
+            # Comma-grouped counts only when INFO records actually pass the filter
+            if self.logger.isEnabledFor(logging.INFO):
+                info("   Input Tokens = %s", f"{input_tokens:,}")
+                info(
+                    "   Output Tokens = %s (reasoning = %s, visibleOutput=%s)",
+                    f"{total_output_tokens:,}", f"{reasoning_tokens:,}", f"{visible_output_tokens:,}",
+                )
+                info("   Total Tokens = %s", f"{tokens_used:,}")
         else:
-            self.logger.info(f"   Token usage: Not available")
+            self.logger.info("   Token usage: Not available")
     
     def log_agent_error(self, agent_name: str, duration: float, error: str) -> None:
         """Log an agent execution error."""
-        self.logger.error(f"❌ {agent_name} failed after {FormatUtils.format_duration(duration)}: {error}")
+        self.logger.error("❌ %s failed after %s: %s", agent_name, FormatUtils.format_duration(duration), error)
     
     def log_file_warning(self, message: str) -> None:
         """Log a file-related warning."""
@@ -172,19 +251,19 @@ class OrchestratorLogger:
     
     def log_config_success(self, message: str) -> None:
         """Log a configuration success message."""
-        self.logger.info(f"OK: {message}")
+        self.logger.info("OK: %s", message)
     
     def log_config_warning(self, message: str) -> None:
         """Log a configuration warning message."""
-        self.logger.warning(f"[WARNING] {message}")
+        self.logger.warning("[WARNING] %s", message)
     
     def log_heartbeat(self, base_name: str) -> None:
         """Log a heartbeat message during parallel processing."""
-        self.logger.info(f"[heartbeat] Parallel first stage still running for {base_name}...")
+        self.logger.info("[heartbeat] Parallel first stage still running for %s...", base_name)
     
     def log_early_exit(self, reason: str) -> None:
         """Log an early exit from the orchestration."""
-        self.logger.info(f"Step 6 verdict is compliant. Ending flow gracefully. {reason}")
+        self.logger.info("Step 6 verdict is compliant. Ending flow gracefully. %s", reason)
     
     def log_workflow_status(self, base_name: str, results: Dict[str, Any]) -> None:
         """
@@ -194,121 +273,97 @@ class OrchestratorLogger:
             base_name: The base name being processed
             results: The results dictionary
         """
-        # Determine success status for each step
-        op_model_gen_success = results.get("lucim_operation_model_generator", {}).get("data") is not None
-        op_model_audit_success = results.get("lucim_operation_model_auditor", {}).get("data") is not None
-        scenario_gen_success = results.get("lucim_scenario_generator", {}).get("data") is not None
-        scenario_audit_success = results.get("lucim_scenario_auditor", {}).get("data") is not None
-        plantuml_gen_success = results.get("lucim_plantuml_diagram_generator", {}).get("data") is not None
-        plantuml_auditor_success = results.get("lucim_plantuml_diagram_auditor", {}).get("data") is not None
-        
-        # No corrector/final auditor in v3 pipeline
-        
-        self.logger.info(f"{base_name} results:")
-        self.logger.info(f"  Step 1 - LUCIM Operation Model Generator: {'✓' if op_model_gen_success else '✗'}")
-        self.logger.info(f"  Step 2 - LUCIM Operation Model Auditor: {'✓' if op_model_audit_success else '✗'}")
-        self.logger.info(f"  Step 3 - LUCIM Scenario Generator: {'✓' if scenario_gen_success else '✗'}")
-        self.logger.info(f"  Step 4 - LUCIM Scenario Auditor: {'✓' if scenario_audit_success else '✗'}")
-        self.logger.info(f"  Step 5 - LUCIM PlantUML Diagram Generator: {'✓' if plantuml_gen_success else '✗'}")
-        self.logger.info(f"  Step 6 - LUCIM PlantUML Diagram Auditor: {'✓' if plantuml_auditor_success else '✗'}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        lines = [f"{base_name} results:"]
+        lines += _step_report(results, "  %s: %s", _CHECK)
+        self.logger.info("\n".join(lines))
     
     def log_error_details(self, results: Dict[str, Any]) -> None:
         """Log detailed error information for failed steps."""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         for step_name, result in results.items():
             if result and isinstance(result, dict) and result.get("errors"):
                 error_count = len(result["errors"])
-                self.logger.warning(f"    {step_name} errors: {error_count} found")
+                self.logger.warning("    %s errors: %d found", step_name, error_count)
     
     def log_execution_timing(self, execution_times: Dict[str, float]) -> None:
-        """Log execution timing breakdown."""
-        self.logger.info(f"\n⏱️  EXECUTION TIMING:")
+        """Log execution timing breakdown as one buffered record."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         total_time = execution_times.get("total_orchestration", 0)
-        self.logger.info(f"   Total Orchestration Time: {FormatUtils.format_duration(total_time)}")
-        
-        # Calculate and display individual agent times
-        total_agent_time = 0
-        agent_times = []
-        
-        for agent_name, duration in execution_times.items():
-            if agent_name != "total_orchestration" and duration > 0:
-                agent_times.append((agent_name, duration))
-                total_agent_time += duration
-        
-        # Sort agents by execution time (descending)
-        agent_times.sort(key=lambda x: x[1], reverse=True)
-        
-        self.logger.info(f"   Total Agent Execution Time: {FormatUtils.format_duration(total_agent_time)}")
-        self.logger.info(f"   Overhead Time: {FormatUtils.format_duration(total_time - total_agent_time)}")
-        
+
+        # One pass to collect agent times, sorted descending
+        agent_times = [
+            (agent_name, duration)
+            for agent_name, duration in execution_times.items()
+            if agent_name != "total_orchestration" and duration > 0
+        ]
+        agent_times.sort(key=itemgetter(1), reverse=True)
+        total_agent_time = sum(duration for _, duration in agent_times)
+
+        lines = [
+            "\n⏱️  EXECUTION TIMING:",
+            f"   Total Orchestration Time: {FormatUtils.format_duration(total_time)}",
+            f"   Total Agent Execution Time: {FormatUtils.format_duration(total_agent_time)}",
+            f"   Overhead Time: {FormatUtils.format_duration(total_time - total_agent_time)}",
+        ]
         if agent_times:
-            self.logger.info(f"   \n   📈 AGENT TIMING BREAKDOWN:")
-            for agent_name, agent_time in agent_times:
-                percentage = (agent_time / total_agent_time * 100) if total_agent_time > 0 else 0
-                self.logger.info(f"      {agent_name}: {FormatUtils.format_duration(agent_time)} ({percentage:.1f}%)")
-    
+            lines.append("   \n   📈 AGENT TIMING BREAKDOWN:")
+            lines += [
+                f"      {agent_name}: {FormatUtils.format_duration(agent_time)}"
+                f" ({agent_time / total_agent_time * 100:.1f}%)"
+                for agent_name, agent_time in agent_times
+            ]
+        self.logger.info("\n".join(lines))
+
     def log_detailed_agent_status(self, results: Dict[str, Any]) -> None:
-        """Log detailed agent status information."""
-        self.logger.info(f"\n🔍 DETAILED AGENT STATUS:")
-        
-        # Determine status for each agent
-        op_model_gen_success = results.get("lucim_operation_model_generator", {}).get("data") is not None
-        op_model_audit_success = results.get("lucim_operation_model_auditor", {}).get("data") is not None
-        scenario_gen_success = results.get("lucim_scenario_generator", {}).get("data") is not None
-        scenario_audit_success = results.get("lucim_scenario_auditor", {}).get("data") is not None
-        plantuml_gen_success = results.get("lucim_plantuml_diagram_generator", {}).get("data") is not None
-        plantuml_auditor_success = results.get("lucim_plantuml_diagram_auditor", {}).get("data") is not None
-        
-        # No corrector/final auditor in v3 pipeline
-        
-        self.logger.info(f"   Step 1 - LUCIM Operation Model Generator Agent: {'✓ SUCCESS' if op_model_gen_success else '✗ FAILED'}")
-        self.logger.info(f"   Step 2 - LUCIM Operation Model Auditor Agent: {'✓ SUCCESS' if op_model_audit_success else '✗ FAILED'}")
-        self.logger.info(f"   Step 3 - LUCIM Scenario Generator Agent: {'✓ SUCCESS' if scenario_gen_success else '✗ FAILED'}")
-        self.logger.info(f"   Step 4 - LUCIM Scenario Auditor Agent: {'✓ SUCCESS' if scenario_audit_success else '✗ FAILED'}")
-        self.logger.info(f"   Step 5 - LUCIM PlantUML Diagram Generator Agent: {'✓ SUCCESS' if plantuml_gen_success else '✗ FAILED'}")
-        self.logger.info(f"   Step 6 - LUCIM PlantUML Diagram Auditor Agent: {'✓ SUCCESS' if plantuml_auditor_success else '✗ FAILED'}")
-    
+        """Log detailed agent status information as one buffered record."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        lines = ["\n🔍 DETAILED AGENT STATUS:"]
+        lines += _step_report(results, "   %s Agent: %s", _STATUS)
+        self.logger.info("\n".join(lines))
+
     def log_output_files(self, base_name: str, timestamp: str, model: str, results: Dict[str, Any]) -> None:
-        """Log information about generated output files."""
-        self.logger.info(f"\n📁 OUTPUT FILES GENERATED:")
-        
+        """Log information about generated output files as one buffered record."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        lines = ["\n📁 OUTPUT FILES GENERATED:"]
         for result_key, result_data in results.items():
             if result_data and isinstance(result_data, dict):
-                agent_type = result_data.get("agent_type", "unknown")
-                if agent_type == "lucim_operation_model_generator":
-                    self.logger.info(f"   • Operation Model: output-data.json")
-                elif agent_type == "lucim_operation_model_auditor":
-                    self.logger.info(f"   • Operation Model Audit: output-data.json")
-                elif agent_type == "lucim_scenario_generator":
-                    self.logger.info(f"   • Scenarios: output-data.json")
-                elif agent_type == "lucim_scenario_auditor":
-                    self.logger.info(f"   • Scenario Audit: output-data.json")
-                elif agent_type == "lucim_plantuml_diagram_generator":
-                    self.logger.info(f"   • PlantUML Diagram: diagram.puml + output-data.json")
-                elif agent_type == "lucim_plantuml_diagram_auditor":
-                    self.logger.info(f"   • PlantUML Diagram Audit: output-data.json")
-    
+                line = _AGENT_OUTPUT_FILES.get(result_data.get("agent_type", "unknown"))
+                if line:
+                    lines.append(line)
+        self.logger.info("\n".join(lines))
+
     def log_pipeline_completion(self, successful_agents: int, total_agents: int) -> None:
-        """Log pipeline completion status."""
-        self.logger.info(f"\n🎯 PIPELINE COMPLETION:")
+        """Log pipeline completion status as one buffered record."""
         if successful_agents == total_agents:
-            self.logger.info(f"   🎉 FULL SUCCESS: All {total_agents} agents completed successfully!")
-            self.logger.info(f"   📋 Final output includes LUCIM-compliant PlantUML sequence diagrams")
+            self.logger.info(
+                "\n🎯 PIPELINE COMPLETION:\n"
+                "   🎉 FULL SUCCESS: All %d agents completed successfully!\n"
+                "   📋 Final output includes LUCIM-compliant PlantUML sequence diagrams",
+                total_agents,
+            )
         elif successful_agents >= 6:  # At least core pipeline completed (all 6 agents)
-            self.logger.info(f"   ⚠️  PARTIAL SUCCESS: {successful_agents}/{total_agents} agents completed")
-            self.logger.info(f"   📋 Some outputs available, but pipeline incomplete")
+            self.logger.info(
+                "\n🎯 PIPELINE COMPLETION:\n"
+                "   ⚠️  PARTIAL SUCCESS: %d/%d agents completed\n"
+                "   📋 Some outputs available, but pipeline incomplete",
+                successful_agents, total_agents,
+            )
         else:
-            self.logger.info(f"   ❌ PIPELINE FAILED: Only {successful_agents}/{total_agents} agents completed")
-            self.logger.info(f"   📋 Limited outputs available")
+            self.logger.info(
+                "\n🎯 PIPELINE COMPLETION:\n"
+                "   ❌ PIPELINE FAILED: Only %d/%d agents completed\n"
+                "   📋 Limited outputs available",
+                successful_agents, total_agents,
+            )
     
     def log_compliance_status(self, final_compliance: Dict[str, Any]) -> None:
-        """Log final compliance status."""
-        self.logger.info(f"\n🔍 COMPLIANCE STATUS:")
-        if final_compliance["status"] == "VERIFIED":
-            self.logger.info(f"   ✅ FINAL COMPLIANCE: VERIFIED")
-            self.logger.info(f"   🎯 Result: Final audit confirms LUCIM compliance")
-        elif final_compliance["status"] == "NON-COMPLIANT":
-            self.logger.info(f"   ❌ FINAL COMPLIANCE: NON-COMPLIANT")
-            self.logger.info(f"   📊 Result: One or more LUCIM rules were violated")
-        else:
-            self.logger.info(f"   ❓ COMPLIANCE STATUS: UNKNOWN")
-            self.logger.info(f"   ⚠️  Result: No authoritative compliance verdict available")
+        """Log final compliance status as one preformatted record."""
+        self.logger.info(
+            _COMPLIANCE_TEMPLATES.get(final_compliance["status"], _COMPLIANCE_UNKNOWN)
+        )
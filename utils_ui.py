@@ -4,63 +4,77 @@ Orchestrator UI Utilities
 Terminal UI interaction and user prompts for the NetLogo orchestrator.
 """
 
+import functools
+import sys
 from typing import List
 import os
 from utils_config_constants import AVAILABLE_MODELS, DEFAULT_MODEL, INPUT_PERSONA_DIR
 import utils_fileio as fileio
 
+
+@functools.lru_cache(maxsize=4)
+def _render_menu(header: str, options: tuple, indent: str = "", width: int = 50) -> str:
+    """Format a numbered selection menu once per (header, options) pair."""
+    lines = [header, "=" * width]
+    lines += [f"{indent}{i}. {option}" for i, option in enumerate(options, 1)]
+    return "\n".join(lines)
+
+
+def _emit(text: str) -> None:
+    """Write pre-joined UI text in one stdout write, flushed before input()."""
+    sys.stdout.write(text + "\n")
+    sys.stdout.flush()
+
 def select_netlogo_case() -> str:
     """Handle NetLogo case selection UI."""
     base_names = fileio.get_netlogo_cases()
     if not base_names:
         return ""
 
-    print("\nAvailable NetLogo Models:")
-    print("="*40)
-    for i, base_name in enumerate(base_names, 1):
-        print(f"{i:2d}. {base_name}")
-    
-    print("\nEnter the number of the NetLogo model to process (or 'q' to quit):")
-    
+    menu_lines = ["\nAvailable NetLogo Models:", "=" * 40]
+    menu_lines += [f"{i:2d}. {base_name}" for i, base_name in enumerate(base_names, 1)]
+    menu_lines.append("\nEnter the number of the NetLogo model to process (or 'q' to quit):")
+    _emit("\n".join(menu_lines))
+
+    # isdigit() replaces exception-driven validation; error strings are
+    # built once instead of per bad input.
+    range_msg = f"Error: Invalid number. Available options: 1-{len(base_names)}"
     while True:
-        try:
-            user_input = input("NetLogo Model > ").strip()
-            
-            if user_input.lower() == 'q':
-                print("Exiting...")
-                return ""
-            
+        user_input = input("NetLogo Model > ").strip()
+
+        if user_input.lower() == 'q':
+            print("Exiting...")
+            return ""
+
+        if user_input.isdigit():
             number = int(user_input)
             if 1 <= number <= len(base_names):
                 return base_names[number - 1]
-            else:
-                print(f"Error: Invalid number. Available options: 1-{len(base_names)}")
-        except ValueError:
+            print(range_msg)
+        else:
             print("Error: Please enter a valid number or 'q' to quit:")
 
 def select_model() -> str:
     """Handle model selection UI."""
-    print("\nAI Model Selection")
-    print("="*50)
-    print("Available AI Models:")
-    for i, model in enumerate(AVAILABLE_MODELS, 1):
-        print(f"{i}. {model}")
-    
-    print(f"\nEnter the number of the AI model to use (press Enter for default: {DEFAULT_MODEL}):")
+    _emit("\n".join((
+        "\nAI Model Selection",
+        _render_menu("Available AI Models:", tuple(AVAILABLE_MODELS)),
+        f"\nEnter the number of the AI model to use (press Enter for default: {DEFAULT_MODEL}):",
+    )))
     
+    range_msg = f"Error: Invalid number. Options: 1-{len(AVAILABLE_MODELS)}"
     while True:
-        try:
-            model_input = input("Model > ").strip()
-            
-            if model_input == "":
-                return DEFAULT_MODEL
-            
+        model_input = input("Model > ").strip()
+
+        if model_input == "":
+            return DEFAULT_MODEL
+
+        if model_input.isdigit():
             model_number = int(model_input)
             if 1 <= model_number <= len(AVAILABLE_MODELS):
                 return AVAILABLE_MODELS[model_number - 1]
-            else:
-                print(f"Error: Invalid number. Options: 1-{len(AVAILABLE_MODELS)}")
-        except ValueError:
+            print(range_msg)
+        else:
             print("Error: Please enter a valid number or press Enter.")
 
 _last_reasoning_effort: str = ""  # track last selection to link default verbosity
@@ -69,36 +83,31 @@ _last_reasoning_effort: str = ""  # track last selection to link default verbosi
 def select_reasoning_effort() -> str:
     """Handle reasoning effort selection UI."""
     options = ["minimal", "low", "medium", "high"]
-    print("\nReasoning Effort Selection")
-    print("="*50)
-    for i, effort in enumerate(options, 1):
-        print(f"{i}. {effort.title()}")
-    print("Enter choice (press Enter for default 'medium'):")
+    _emit("\n".join((
+        _render_menu("\nReasoning Effort Selection", tuple(e.title() for e in options)),
+        "Enter choice (press Enter for default 'medium'):",
+    )))
     
+    range_msg = f"Error: Invalid choice. Options: 1-{len(options)}"
     while True:
         user_input = input("Reasoning effort > ").strip()
         if user_input == "":
             global _last_reasoning_effort
             _last_reasoning_effort = "medium"
             return "medium"
-        try:
+        if user_input.isdigit():
             choice = int(user_input)
             if 1 <= choice <= len(options):
                 selected = options[choice - 1]
                 _last_reasoning_effort = selected
                 return selected
-            else:
-                print(f"Error: Invalid choice. Options: 1-{len(options)}")
-        except ValueError:
+            print(range_msg)
+        else:
             print("Error: Please enter a valid number.")
 
 def select_text_verbosity() -> str:
     """Handle text verbosity selection UI."""
     options = ["low", "medium", "high"]
-    print("\nText Verbosity Selection")
-    print("="*50)
-    for i, verbosity in enumerate(options, 1):
-        print(f"{i}. {verbosity.title()}")
     # Determine linked default based on last reasoning selection
     linked_default = None
     if _last_reasoning_effort in ("minimal", "low"):
@@ -108,35 +117,43 @@ def select_text_verbosity() -> str:
     elif _last_reasoning_effort == "high":
         linked_default = "high"
     if linked_default:
-        print(f"Press Enter for default linked to reasoning ('{linked_default}'):")
+        prompt = f"Press Enter for default linked to reasoning ('{linked_default}'):"
     else:
-        print("Enter choice (press Enter for default 'medium'):")
+        prompt = "Enter choice (press Enter for default 'medium'):"
+    _emit("\n".join((
+        _render_menu("\nText Verbosity Selection", tuple(v.title() for v in options)),
+        prompt,
+    )))
 
+    range_msg = f"Error: Invalid choice. Options: 1-{len(options)}"
     while True:
         user_input = input("Text verbosity > ").strip()
         if user_input == "":
             if linked_default:
                 return linked_default
             return "medium"
-        try:
+        if user_input.isdigit():
             choice = int(user_input)
             if 1 <= choice <= len(options):
                 return options[choice - 1]
-            else:
-                print(f"Error: Invalid choice. Options: 1-{len(options)}")
-        except ValueError:
+            print(range_msg)
+        else:
             print("Error: Please enter a valid number.")
 
+@functools.lru_cache(maxsize=1)
 def _get_available_persona_sets() -> List[str]:
-    if not INPUT_PERSONA_DIR.exists():
+    # Cached: the persona directory does not change mid-run. scandir reuses
+    # the d_type from the readdir buffer, so is_dir costs no extra stat; a
+    # missing directory is the EAFP empty case.
+    try:
+        with os.scandir(INPUT_PERSONA_DIR) as entries:
+            return sorted(
+                entry.name
+                for entry in entries
+                if not entry.name.startswith('.') and entry.is_dir(follow_symlinks=False)
+            )
+    except FileNotFoundError:
         return []
-    
-    persona_sets = []
-    for item in INPUT_PERSONA_DIR.iterdir():
-        if item.is_dir() and not item.name.startswith('.'):
-            persona_sets.append(item.name)
-    
-    return sorted(persona_sets)
 
 def select_persona_set() -> str:
     """Interactive selection of persona set."""
@@ -146,26 +163,24 @@ def select_persona_set() -> str:
         print("No persona sets found.")
         return "persona-v2-after-ng-meeting"
 
-    print("\nAvailable Persona Sets:")
-    print("=" * 50)
-    for i, persona_set in enumerate(available_persona_sets, 1):
-        print(f"  {i}. {persona_set}")
-    
     # Prefer persona-v2-after-ng-meeting as default if available, otherwise fallback to persona-v1
     default_persona = "persona-v2-after-ng-meeting" if "persona-v2-after-ng-meeting" in available_persona_sets else "persona-v1"
-    print(f"Default: {default_persona} (press Enter to use default)")
+    _emit("\n".join((
+        _render_menu("\nAvailable Persona Sets:", tuple(available_persona_sets), indent="  "),
+        f"Default: {default_persona} (press Enter to use default)",
+    )))
     
+    range_msg = f"Please enter a number between 1 and {len(available_persona_sets)}"
     while True:
-        try:
-            choice = input(f"Select persona set > ").strip()
-            
-            if not choice:
-                return default_persona
-            
+        choice = input("Select persona set > ").strip()
+
+        if not choice:
+            return default_persona
+
+        if choice.isdigit():
             choice_num = int(choice)
             if 1 <= choice_num <= len(available_persona_sets):
                 return available_persona_sets[choice_num - 1]
-            else:
-                print(f"Please enter a number between 1 and {len(available_persona_sets)}")
-        except ValueError:
+            print(range_msg)
+        else:
             print("Please enter a valid number or press Enter.")